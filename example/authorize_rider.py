@@ -39,9 +39,16 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 from builtins import input
+from time import time
 
-from yaml import safe_dump
+from yaml import dump
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+from example import token_cache
 from example import utils  # NOQA
 from example.utils import fail_print
 from example.utils import response_print
@@ -92,12 +99,14 @@ def authorization_code_grant_flow(credentials, storage_filename):
         return
 
     credential = session.oauth2credential
+    issued_at = int(time())
 
     credential_data = {
         'client_id': credential.client_id,
         'redirect_url': credential.redirect_url,
         'access_token': credential.access_token,
-        'expires_in_seconds': credential.expires_in_seconds,
+        'expires_in_seconds': credential.expires_in_seconds - issued_at,
+        'issued_at': issued_at,
         'scopes': list(credential.scopes),
         'grant_type': credential.grant_type,
         'client_secret': credential.client_secret,
@@ -105,9 +114,18 @@ def authorization_code_grant_flow(credentials, storage_filename):
     }
 
     with open(storage_filename, 'w') as yaml_file:
-        yaml_file.write(safe_dump(credential_data, default_flow_style=False))
-
-    return UberRidesClient(session, sandbox_mode=True)
+        dump(
+            credential_data,
+            stream=yaml_file,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+        )
+
+    api_client = UberRidesClient(session, sandbox_mode=True)
+
+    # later create_uber_client calls on the stored credentials reuse it
+    token_cache.set_client(credential_data, api_client)
+    return api_client
 
 
 def hello_user(api_client):
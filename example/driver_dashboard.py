@@ -7,10 +7,14 @@ from example.utils import import_app_credentials
 from uber_rides.auth import AuthorizationCodeGrant
 from uber_rides.client import UberRidesClient
 
-import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import time
 
 app = Flask(__name__, template_folder="./")
 
+DEFAULT_DATE_FORMAT = '%b %d, %Y at %H:%M'
+
 credentials = import_app_credentials('config.driver.yaml')
 
 auth_flow = AuthorizationCodeGrant(
@@ -20,16 +24,19 @@ auth_flow = AuthorizationCodeGrant(
     credentials.get('redirect_url'),
 )
 
+# the authorization URL only depends on app credentials and the state token
+AUTH_URL = auth_flow.get_authorization_url()
+
 
 @app.template_filter('date')
-def date(value, format='%b %d, %Y at %H:%M'):
-    return datetime.datetime.fromtimestamp(value).strftime(format)
+def date(value, format=DEFAULT_DATE_FORMAT):
+    return time.strftime(format, time.localtime(value))
 
 
 @app.route('/')
 def index():
     """Index controller to redirect user to sign in with uber."""
-    return redirect(auth_flow.get_authorization_url())
+    return redirect(AUTH_URL)
 
 
 @app.route('/uber/connect')
@@ -40,17 +47,16 @@ def connect():
     session = auth_flow.get_session(request.url)
     client = UberRidesClient(session)
 
-    # Fetch profile for driver
-    profile = client.get_driver_profile().json
-
-    # Fetch last 50 trips and payments for driver
-    trips = client.get_driver_trips(0, 50).json
-    payments = client.get_driver_payments(0, 50).json
+    # Fetch profile, last 50 trips and payments for driver concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        profile = executor.submit(client.get_driver_profile)
+        trips = executor.submit(client.get_driver_trips, 0, 50)
+        payments = executor.submit(client.get_driver_payments, 0, 50)
 
     return render_template('driver_dashboard.html',
-                           profile=profile,
-                           trips=trips['trips'],
-                           payments=payments['payments']
+                           profile=profile.result().json,
+                           trips=trips.result().json['trips'],
+                           payments=payments.result().json['payments']
                            )
 
 
@@ -21,13 +21,15 @@
 """Use an UberRidesClient to request and complete a ride.
 
 This example demonstrates how to use an UberRidesClient to request a ride
-under surge. After successfully requesting a ride, it updates the
-ride status to 'completed' and deactivates surge.
+under surge and then deactivates surge. With --full, it also requests
+an upfront pricing ride and updates both rides' status to 'completed'.
 
 To run this example:
 
     (1) Run `python authorize_rider.py` to get OAuth 2.0 Credentials
-    (2) Run `python request_ride.py`
+    (2) Run `python request_ride.py`, or `python request_ride.py --full`
+        to also step an upfront pricing ride and the surge ride through
+        to completion
     (3) The UberRidesClient will make API calls and print the
         results to your terminal.
 """
@@ -46,6 +48,8 @@ except ImportError:
 
 from builtins import input
 
+import sys
+
 from example.utils import create_uber_client
 from example.utils import fail_print
 from example.utils import import_oauth2_credentials
@@ -63,6 +67,9 @@ UFP_PRODUCT_ID = '26546650-e557-4a7b-86e7-6a3942445247'
 # uber black
 SURGE_PRODUCT_ID = 'd4abaae7-f4d6-4152-91cc-77523e8165a4'
 
+# ride requests to make before giving up on confirming surge
+MAX_SURGE_REQUEST_ATTEMPTS = 3
+
 # California Academy of Sciences
 START_LAT = 37.770
 START_LNG = -122.466
@@ -184,55 +191,81 @@ def request_ufp_ride(api_client):
         return request.json.get('request_id')
 
 
-def request_surge_ride(api_client, surge_confirmation_id=None):
+def confirm_surge(surge_confirmation_href):
+    """Prompt the user to confirm surge and return the confirmation ID.
+
+    Parameters
+        surge_confirmation_href (str)
+            URL where the user can confirm the surge price.
+
+    Returns
+        The surge confirmation ID from the URL the user was redirected to.
+    """
+    surge_message = 'Confirm surge by visiting: \n{}\n'
+    surge_message = surge_message.format(surge_confirmation_href)
+    response_print(surge_message)
+
+    confirm_url = 'Copy the URL you are redirected to and paste here: \n'
+    result = input(confirm_url).strip()
+
+    querystring = urlparse(result).query
+    query_params = parse_qs(querystring)
+    return query_params.get('surge_confirmation_id')[0]
+
+
+def request_surge_ride(
+    api_client,
+    surge_confirmation_id=None,
+    max_attempts=MAX_SURGE_REQUEST_ATTEMPTS,
+):
     """Use an UberRidesClient to request a ride and print the results.
 
     If the product has a surge_multiple greater than or equal to 2.0,
     a SurgeError is raised. Confirm surge by visiting the
-    surge_confirmation_url and automatically try the request again.
+    surge_confirmation_url and automatically try the request again,
+    up to max_attempts requests in total.
 
     Parameters
         api_client (UberRidesClient)
             An authorized UberRidesClient with 'request' scope.
         surge_confirmation_id (string)
             Unique identifer received after confirming surge.
+        max_attempts (int)
+            Maximum number of ride requests to make.
 
     Returns
         The unique ID of the requested ride.
     """
-    try:
-        request = api_client.request_ride(
-            product_id=SURGE_PRODUCT_ID,
-            start_latitude=START_LAT,
-            start_longitude=START_LNG,
-            end_latitude=END_LAT,
-            end_longitude=END_LNG,
-            surge_confirmation_id=surge_confirmation_id,
-            seat_count=2
-        )
-
-    except SurgeError as e:
-        surge_message = 'Confirm surge by visiting: \n{}\n'
-        surge_message = surge_message.format(e.surge_confirmation_href)
-        response_print(surge_message)
-
-        confirm_url = 'Copy the URL you are redirected to and paste here: \n'
-        result = input(confirm_url).strip()
-
-        querystring = urlparse(result).query
-        query_params = parse_qs(querystring)
-        surge_id = query_params.get('surge_confirmation_id')[0]
-
-        # automatically try request again
-        return request_surge_ride(api_client, surge_id)
-
-    except (ClientError, ServerError) as error:
-        fail_print(error)
-        return
-
-    else:
-        success_print(request.json)
-        return request.json.get('request_id')
+    for attempt in range(1, max_attempts + 1):
+        try:
+            request = api_client.request_ride(
+                product_id=SURGE_PRODUCT_ID,
+                start_latitude=START_LAT,
+                start_longitude=START_LNG,
+                end_latitude=END_LAT,
+                end_longitude=END_LNG,
+                surge_confirmation_id=surge_confirmation_id,
+                seat_count=2
+            )
+
+        except SurgeError as e:
+            # only ask for a confirmation another request will use
+            if attempt == max_attempts:
+                break
+
+            # try request again with the new confirmation
+            surge_confirmation_id = confirm_surge(e.surge_confirmation_href)
+
+        except (ClientError, ServerError) as error:
+            fail_print(error)
+            return
+
+        else:
+            success_print(request.json)
+            return request.json.get('request_id')
+
+    message = 'Surge was not confirmed after {} ride requests.'
+    paragraph_print(message.format(max_attempts))
 
 
 def get_ride_details(api_client, ride_id):
@@ -254,15 +287,33 @@ def get_ride_details(api_client, ride_id):
         success_print(ride_details.json)
 
 
-if __name__ == '__main__':
-    """Run the example.
+def demo_minimal(api_client):
+    """Request a ride under surge with the fewest API calls.
 
-    Create an UberRidesClient from OAuth 2.0 Credentials, update a sandbox
-    product's surge, request and complete a ride.
+    Parameters
+        api_client (UberRidesClient)
+            An authorized UberRidesClient with 'request' scope.
     """
-    credentials = import_oauth2_credentials()
-    api_client = create_uber_client(credentials)
+    paragraph_print("Activate surge.")
+    update_surge(api_client, 2.0)
+
+    paragraph_print("Request a ride with surging product.")
+    ride_id = request_surge_ride(api_client)
+
+    paragraph_print("Ride details.")
+    get_ride_details(api_client, ride_id)
+
+    paragraph_print("Deactivate surge.")
+    update_surge(api_client, 1.0)
+
 
+def demo_full(api_client):
+    """Request and complete rides with upfront pricing and under surge.
+
+    Parameters
+        api_client (UberRidesClient)
+            An authorized UberRidesClient with 'request' scope.
+    """
     # ride request with upfront pricing flow
 
     paragraph_print("Request a ride with upfront pricing product.")
@@ -316,3 +367,19 @@ if __name__ == '__main__':
 
     paragraph_print("Deactivate surge.")
     update_surge(api_client, 1.0)
+
+
+if __name__ == '__main__':
+    """Run the example.
+
+    Create an UberRidesClient from OAuth 2.0 Credentials, update a sandbox
+    product's surge and request a ride. Pass --full to also request an
+    upfront pricing ride and step both rides through to completion.
+    """
+    credentials = import_oauth2_credentials()
+    api_client = create_uber_client(credentials)
+
+    if '--full' in sys.argv:
+        demo_full(api_client)
+    else:
+        demo_minimal(api_client)
@@ -6,11 +6,17 @@ from example.utils import import_app_credentials
 
 from uber_rides.auth import AuthorizationCodeGrant
 from uber_rides.client import UberRidesClient
+from uber_rides.errors import ClientError
+from uber_rides.errors import ServerError
 
 from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor
 
 app = Flask(__name__, template_folder="./")
 
+TRIPS_PAGE_SIZE = 50
+TRIPS_PAGES_IN_FLIGHT = 8
+
 credentials = import_app_credentials('config.rider.yaml')
 
 auth_flow = AuthorizationCodeGrant(
@@ -20,11 +26,56 @@ auth_flow = AuthorizationCodeGrant(
     credentials.get('redirect_url'),
 )
 
+# the authorization URL only depends on app credentials and the state token
+AUTH_URL = auth_flow.get_authorization_url()
+
 
 @app.route('/')
 def index():
     """Index controller to redirect user to sign in with uber."""
-    return redirect(auth_flow.get_authorization_url())
+    return redirect(AUTH_URL)
+
+
+def get_rider_trips_page(client, offset):
+    """Fetch a single page of trips from history endpoint."""
+    response = client.get_rider_trips(
+        limit=TRIPS_PAGE_SIZE,
+        offset=offset)
+    # Response.json is None when the body is not JSON
+    return (response.json or {}).get('history') or []
+
+
+def get_all_rider_trips(client):
+    """Fetch all trips from history endpoint.
+
+    Pages are requested TRIPS_PAGES_IN_FLIGHT at a time and collected in
+    offset order until an empty page is returned.
+    """
+    trips = []
+    offset = 0
+    with ThreadPoolExecutor(max_workers=TRIPS_PAGES_IN_FLIGHT) as executor:
+        while True:
+            pages = [
+                executor.submit(get_rider_trips_page, client, page_offset)
+                for page_offset in range(
+                    offset,
+                    offset + TRIPS_PAGE_SIZE * TRIPS_PAGES_IN_FLIGHT,
+                    TRIPS_PAGE_SIZE,
+                )
+            ]
+            offset += TRIPS_PAGE_SIZE * TRIPS_PAGES_IN_FLIGHT
+
+            for page in pages:
+                try:
+                    history = page.result()
+                except (ClientError, ServerError) as error:
+                    app.logger.warning('Failed to fetch trips: %s', error)
+                    return trips
+
+                if not history:
+                    return trips
+
+                trips.extend(history)
 
 
 @app.route('/uber/connect')
@@ -35,48 +86,31 @@ def connect():
     session = auth_flow.get_session(request.url)
     client = UberRidesClient(session)
 
-    # Fetch profile for rider
-    profile = client.get_rider_profile().json
+    # Fetch profile and trip history for rider concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        profile = executor.submit(client.get_rider_profile)
+        trips = executor.submit(get_all_rider_trips, client)
 
-    # Fetch all trips from history endpoint
-    trips = []
-    i = 0
-    while True:
-        try:
-            response = client.get_rider_trips(
-                limit=50,
-                offset=i)
-            i += 50
-            if len(response.json['history']) > 0:
-                trips += response.json['history']
-            else:
-                break
-        except:
-            break
-            pass
+    profile = profile.result().json
+    trips = trips.result()
 
     # Compute trip stats for # of rides and distance
     total_rides = 0
     total_distance_traveled = 0
 
-    # Compute ranked list of # trips per city
-    cities = list()
+    # Count trips per city in the same pass
+    locations_counter = Counter()
     for ride in trips:
-        cities.append(ride['start_city']['display_name'])
+        locations_counter[ride['start_city']['display_name']] += 1
 
         # only parse actually completed trips
         if ride['distance'] > 0:
             total_rides += 1
             total_distance_traveled += int(ride['distance'])
 
-    total_cities = 0
-    locations_counter = Counter(cities)
-    locations = OrderedDict()
-    cities_by_frequency = sorted(cities, key=lambda x: -locations_counter[x])
-    for city in list(cities_by_frequency):
-        if city not in locations:
-            total_cities += 1
-            locations[city] = cities.count(city)
+    # Compute ranked list of # trips per city
+    locations = OrderedDict(locations_counter.most_common())
+    total_cities = len(locations)
 
     return render_template('rider_dashboard.html',
                            profile=profile,
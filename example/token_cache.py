@@ -0,0 +1,114 @@
+# Copyright (c) 2017 Uber Technologies, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""In-process cache of authorized clients for command line examples.
+
+Clients are keyed by a SHA-256 digest of the full OAuth 2.0 credential
+they were built from, so that secrets are never held in plain dictionary
+keys and new token material always gets a new client. A cached client
+refreshes its own access token as it makes requests; clients from grants
+that cannot refresh are dropped once their token is within
+EXPIRY_MARGIN_SECONDS of expiring.
+"""
+
+from hashlib import sha256
+from threading import Lock
+from time import time
+
+from uber_rides.utils import auth
+
+
+EXPIRY_MARGIN_SECONDS = 5
+
+# UberRidesClient refreshes stale tokens from these grants by itself
+SELF_REFRESHING_GRANT_TYPES = frozenset([
+    auth.AUTHORIZATION_CODE_GRANT,
+    auth.CLIENT_CREDENTIALS_GRANT,
+])
+
+_clients = {}
+_lock = Lock()
+
+
+def _cache_key(credentials):
+    """Build a cache key from OAuth 2.0 credentials.
+
+    Parameters
+        credentials (dict)
+            Dictionary of OAuth 2.0 credentials.
+
+    Returns
+        (str)
+            Hex digest identifying the credentials.
+    """
+    key = repr((
+        credentials.get('client_id'),
+        tuple(sorted(credentials.get('scopes') or ())),
+        credentials.get('client_secret'),
+        credentials.get('access_token'),
+        credentials.get('refresh_token'),
+    ))
+    return sha256(key.encode('utf-8')).hexdigest()
+
+
+def get_client(credentials):
+    """Look up a cached client built from the same credentials.
+
+    Parameters
+        credentials (dict)
+            Dictionary of OAuth 2.0 credentials.
+
+    Returns
+        (UberRidesClient)
+            The cached client, or None if there is no usable entry.
+    """
+    key = _cache_key(credentials)
+
+    with _lock:
+        api_client = _clients.get(key)
+
+        if api_client is None:
+            return None
+
+        # the client may have refreshed since it was cached
+        credential = api_client.session.oauth2credential
+        if (
+            credential.grant_type in SELF_REFRESHING_GRANT_TYPES or
+            time() < credential.expires_in_seconds - EXPIRY_MARGIN_SECONDS
+        ):
+            return api_client
+
+        del _clients[key]
+        return None
+
+
+def set_client(credentials, api_client):
+    """Cache an authorized client under the credentials it was built from.
+
+    Parameters
+        credentials (dict)
+            Dictionary of OAuth 2.0 credentials.
+        api_client (UberRidesClient)
+            An UberRidesClient with OAuth 2.0 credentials.
+    """
+    key = _cache_key(credentials)
+
+    with _lock:
+        _clients[key] = api_client
@@ -20,17 +20,25 @@
 
 """General utilities for command line examples."""
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
-from collections import namedtuple
-from yaml import safe_load
-
+from functools import lru_cache
+from json import dumps as json_dumps
+from json import load as json_load
+from json import loads as json_loads
+from operator import itemgetter
+from os import remove
+from os import replace
+from os import stat
+from time import time
+from types import MappingProxyType
+from urllib3.util.retry import Retry
+
+import sys
+
+from example import token_cache
 from uber_rides.client import UberRidesClient
 from uber_rides.session import OAuth2Credential
 from uber_rides.session import Session
+from uber_rides.utils.request import create_requests_session
 
 
 # set your app credentials here
@@ -45,14 +53,69 @@ DEFAULT_CONFIG_VALUES = frozenset([
     'INSERT_REDIRECT_URL_HERE',
 ])
 
-Colors = namedtuple('Colors', 'response, success, fail, end')
-COLORS = Colors(
-    response='\033[94m',
-    success='\033[92m',
-    fail='\033[91m',
-    end='\033[0m',
+# parsed YAML files are cached next to the original with this suffix
+JSON_CACHE_SUFFIX = '.json.cache'
+
+# keys every OAuth 2.0 storage file must contain
+_get_required_oauth2_values = itemgetter(
+    'access_token',
+    'client_id',
+    'expires_in_seconds',
+    'grant_type',
+    'scopes',
 )
 
+COLOR_RESPONSE = '\033[94m'
+COLOR_SUCCESS = '\033[92m'
+COLOR_FAIL = '\033[91m'
+COLOR_END = '\033[0m'
+
+# output is composed up front so each message is a single write
+_RESPONSE_PREFIX = COLOR_RESPONSE + ' '
+_SUCCESS_PREFIX = COLOR_SUCCESS + ' '
+_FAIL_PREFIX = COLOR_FAIL + ' '
+_END = ' ' + COLOR_END + '\n'
+
+# terminals get the same output pre-encoded, skipping the text layer
+_RESPONSE_PREFIX_BYTES = _RESPONSE_PREFIX.encode('ascii')
+_SUCCESS_PREFIX_BYTES = _SUCCESS_PREFIX.encode('ascii')
+_FAIL_PREFIX_BYTES = _FAIL_PREFIX.encode('ascii')
+_END_BYTES = _END.encode('ascii')
+
+
+@lru_cache(maxsize=4)
+def _is_terminal(stream):
+    """Check once per stream whether it is a terminal with a byte buffer."""
+    return hasattr(stream, 'buffer') and stream.isatty()
+
+
+def _colored_write(prefix, prefix_bytes, message):
+    """Write a colored message to stdout in a single call.
+
+    Parameters
+        prefix (str)
+            Color escape and padding written before the message.
+        prefix_bytes (bytes)
+            The same prefix, already encoded.
+        message (str)
+            Message to print.
+    """
+    stream = sys.stdout
+
+    if not _is_terminal(stream):
+        stream.write(prefix + str(message) + _END)
+        return
+
+    # flush pending text first so output stays in order
+    stream.flush()
+    encoding = stream.encoding or 'utf-8'
+    stream.buffer.write(
+        prefix_bytes +
+        str(message).encode(encoding, 'replace') +
+        _END_BYTES
+    )
+    stream.buffer.flush()
+
 
 def success_print(message):
     """Print a message in green text.
@@ -61,7 +124,7 @@ def success_print(message):
         message (str)
             Message to print.
     """
-    print(COLORS.success, message, COLORS.end)
+    _colored_write(_SUCCESS_PREFIX, _SUCCESS_PREFIX_BYTES, message)
 
 
 def response_print(message):
@@ -71,7 +134,7 @@ def response_print(message):
         message (str)
             Message to print.
     """
-    print(COLORS.response, message, COLORS.end)
+    _colored_write(_RESPONSE_PREFIX, _RESPONSE_PREFIX_BYTES, message)
 
 
 def fail_print(error):
@@ -81,7 +144,7 @@ def fail_print(error):
         error (HTTPError)
             Error object to print.
     """
-    print(COLORS.fail, error.message, COLORS.end)
+    _colored_write(_FAIL_PREFIX, _FAIL_PREFIX_BYTES, error)
 
 
 def paragraph_print(message):
@@ -91,77 +154,151 @@ def paragraph_print(message):
         message (str)
             Message to print.
     """
-    paragraph = '\n{}\n'
-    print(paragraph.format(message))
+    sys.stdout.write(f'\n{message}\n\n')
+
+
+def _load_with_cache(filename):
+    """Load a YAML file, reusing a JSON copy if it is up to date.
+
+    The JSON copy records the modification time and size of the YAML file
+    it was made from and is only used while both still match exactly.
+    Files whose contents do not survive a JSON round trip unchanged
+    (e.g. dates or non-string keys) are never cached.
+
+    Parameters
+        filename (str)
+            Name of YAML file.
+
+    Returns
+        (dict)
+            The parsed contents of the file.
+    """
+    cache_filename = filename + JSON_CACHE_SUFFIX
+    source_stat = stat(filename)
+    source = [source_stat.st_mtime_ns, source_stat.st_size]
+
+    try:
+        with open(cache_filename, 'rb') as cache_file:
+            cache = json_load(cache_file)
+        if cache['source'] == source:
+            return cache['data']
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # PyYAML is only imported when a config file actually has to be parsed
+    import yaml
+
+    with open(filename, 'rb') as yaml_file:
+        data = yaml.load(
+            yaml_file,
+            Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader),
+        )
+
+    try:
+        cache_text = json_dumps({'source': source, 'data': data})
+    except (TypeError, ValueError):
+        return data
+
+    if json_loads(cache_text)['data'] != data:
+        return data
+
+    # write to a temporary file first so readers never see a partial cache
+    temp_filename = cache_filename + '.tmp'
+    try:
+        with open(temp_filename, 'w') as cache_file:
+            cache_file.write(cache_text)
+        replace(temp_filename, cache_filename)
+    except (IOError, OSError):
+        try:
+            remove(temp_filename)
+        except OSError:
+            pass
+
+    return data
 
 
 def import_app_credentials(filename=CREDENTIALS_FILENAME):
     """Import app credentials from configuration file.
 
+    Results are cached until the configuration file is modified, so
+    repeated imports in the same process do not re-read the file.
+
     Parameters
         filename (str)
             Name of configuration file.
 
     Returns
-        credentials (dict)
+        credentials (MappingProxyType)
             All your app credentials and information
             imported from the configuration file.
     """
-    with open(filename, 'r') as config_file:
-        config = safe_load(config_file)
+    return _import_app_credentials(filename, stat(filename).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _import_app_credentials(filename, mtime_ns):
+    """Import app credentials from one version of a configuration file."""
+    config = _load_with_cache(filename)
 
     client_id = config['client_id']
     client_secret = config['client_secret']
     redirect_url = config['redirect_url']
 
-    config_values = [client_id, client_secret, redirect_url]
+    config_values = (client_id, client_secret, redirect_url)
 
-    for value in config_values:
-        if value in DEFAULT_CONFIG_VALUES:
-            exit('Missing credentials in {}'.format(filename))
+    if not DEFAULT_CONFIG_VALUES.isdisjoint(config_values):
+        exit(f'Missing credentials in {filename}')
 
-    credentials = {
+    return MappingProxyType({
         'client_id': client_id,
         'client_secret': client_secret,
         'redirect_url': redirect_url,
-        'scopes': set(config['scopes']),
-    }
-
-    return credentials
+        'scopes': frozenset(config['scopes']),
+    })
 
 
 def import_oauth2_credentials(filename=STORAGE_FILENAME):
     """Import OAuth 2.0 session credentials from storage file.
 
+    Results are cached until the storage file is modified.
+
     Parameters
         filename (str)
             Name of storage file.
 
     Returns
-        credentials (dict)
+        credentials (MappingProxyType)
             All your app credentials and information
             imported from the configuration file.
     """
-    with open(filename, 'r') as storage_file:
-        storage = safe_load(storage_file)
+    return _import_oauth2_credentials(filename, stat(filename).st_mtime_ns)
 
-    # depending on OAuth 2.0 grant_type, these values may not exist
-    client_secret = storage.get('client_secret')
-    redirect_url = storage.get('redirect_url')
-    refresh_token = storage.get('refresh_token')
 
-    credentials = {
-        'access_token': storage['access_token'],
-        'client_id': storage['client_id'],
-        'client_secret': client_secret,
-        'expires_in_seconds': storage['expires_in_seconds'],
-        'grant_type': storage['grant_type'],
-        'redirect_url': redirect_url,
-        'refresh_token': refresh_token,
-        'scopes': storage['scopes'],
-    }
+@lru_cache(maxsize=8)
+def _import_oauth2_credentials(filename, mtime_ns):
+    """Import OAuth 2.0 credentials from one version of a storage file."""
+    storage = _load_with_cache(filename)
+
+    (
+        access_token,
+        client_id,
+        expires_in_seconds,
+        grant_type,
+        scopes,
+    ) = _get_required_oauth2_values(storage)
 
-    return credentials
+    # depending on OAuth 2.0 grant_type, these values may not exist
+    return MappingProxyType({
+        'access_token': access_token,
+        'client_id': client_id,
+        'client_secret': storage.get('client_secret'),
+        'expires_in_seconds': expires_in_seconds,
+        'grant_type': grant_type,
+        'issued_at': storage.get('issued_at'),
+        'redirect_url': storage.get('redirect_url'),
+        'refresh_token': storage.get('refresh_token'),
+        'scopes': frozenset(scopes),
+    })
 
 
 def create_uber_client(credentials):
@@ -175,15 +312,34 @@ def create_uber_client(credentials):
         (UberRidesClient)
             An authorized UberRidesClient to access API resources.
     """
+    api_client = token_cache.get_client(credentials)
+
+    if api_client is not None:
+        return api_client
+
+    # storage files without issued_at hold an absolute expiry timestamp
+    issued_at = credentials.get('issued_at') or 0
+    expires_in_seconds = credentials.get('expires_in_seconds')
+    expires_in_seconds -= int(time()) - issued_at
+
     oauth2credential = OAuth2Credential(
         client_id=credentials.get('client_id'),
         access_token=credentials.get('access_token'),
-        expires_in_seconds=credentials.get('expires_in_seconds'),
+        expires_in_seconds=expires_in_seconds,
         scopes=credentials.get('scopes'),
         grant_type=credentials.get('grant_type'),
         redirect_url=credentials.get('redirect_url'),
         client_secret=credentials.get('client_secret'),
         refresh_token=credentials.get('refresh_token'),
     )
-    session = Session(oauth2credential=oauth2credential)
-    return UberRidesClient(session, sandbox_mode=True)
+
+    session = Session(
+        oauth2credential=oauth2credential,
+        requests_session=create_requests_session(
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        ),
+    )
+
+    api_client = UberRidesClient(session, sandbox_mode=True)
+    token_cache.set_client(credentials, api_client)
+    return api_client
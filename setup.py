@@ -1,14 +1,11 @@
 #!/usr/bin/env python
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
+from pathlib import Path
 from setuptools import find_packages
 from setuptools import setup
 
-with open('README.rst') as f:
-    readme = f.read()
+readme = Path(__file__).parent.joinpath('README.rst').read_text(
+    encoding='utf-8',
+)
 
 setup(
     name='uber_rides',
@@ -20,9 +17,10 @@ setup(
     license='MIT',
     author='Uber Technologies, Inc.',
     author_email='dev-advocates@uber.com',
+    python_requires='>=3.7',
     install_requires=['requests', 'pyyaml'],
     extras_require={
-        ':python_version == "2.7"': ['future'],
+        'speedups': ['orjson'],
     },
     tests_require=['pytest', 'mock', 'vcrpy'],
     keywords=['uber', 'api', 'sdk', 'rides', 'library'],
@@ -18,27 +18,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
+from mock import Mock
+from mock import patch
 from pytest import fixture
 from pytest import raises
-
-try:
-    from urllib.parse import quote
-    from urllib.parse import parse_qs
-    from urllib.parse import urlparse
-except ImportError:
-    from urllib import quote
-    from urlparse import parse_qs
-    from urlparse import urlparse
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
 
 from tests.vcr_config import uber_vcr
 from uber_rides.auth import AuthorizationCodeGrant
 from uber_rides.auth import ClientCredentialGrant
 from uber_rides.auth import ImplicitGrant
+from uber_rides.auth import _request_access_token
 from uber_rides.auth import refresh_access_token
 from uber_rides.errors import UberIllegalState
 from uber_rides.session import OAuth2Credential
@@ -56,17 +47,13 @@ STATE_TOKEN = 'rides-sdk'
 
 REDIRECT_URL = 'https://uberapitester.com/api/v1/uber/oauth'
 
-SCOPES = {'profile', 'history'}
-CLIENT_CREDENTIALS_SCOPES = {'partner.referrals'}
+SCOPES = frozenset(['profile', 'history'])
+CLIENT_CREDENTIALS_SCOPES = frozenset(['partner.referrals'])
 
 EXPIRES_IN_SECONDS = 3000
 
-EXPECTED_QUERYSTRING = (
-    'scope={}&state={}&redirect_uri={}'
-    '&response_type={}&client_id={}'
-)
-
 
+# function scoped because tests reassign its state_token
 @fixture
 def auth_code_grant():
     return AuthorizationCodeGrant(
@@ -77,7 +64,7 @@ def auth_code_grant():
     )
 
 
-@fixture
+@fixture(scope='module')
 def auth_code_oauth2credential():
     return OAuth2Credential(
         client_id=CLIENT_ID,
@@ -91,7 +78,7 @@ def auth_code_oauth2credential():
     )
 
 
-@fixture
+@fixture(scope='module')
 def implicit_grant():
     return ImplicitGrant(
         client_id=CLIENT_ID,
@@ -100,7 +87,7 @@ def implicit_grant():
     )
 
 
-@fixture
+@fixture(scope='module')
 def implicit_oauth2credential():
     return OAuth2Credential(
         client_id=CLIENT_ID,
@@ -114,7 +101,7 @@ def implicit_oauth2credential():
     )
 
 
-@fixture
+@fixture(scope='module')
 def client_credential_grant():
     return ClientCredentialGrant(
         client_id=CLIENT_ID,
@@ -123,7 +110,7 @@ def client_credential_grant():
     )
 
 
-@fixture
+@fixture(scope='module')
 def client_credential_oauth2credential():
     return OAuth2Credential(
         client_id=CLIENT_ID,
@@ -144,33 +131,55 @@ def test_auth_code_grant_get_authorization_url(auth_code_grant):
     assert parsed_url.netloc == auth.AUTH_HOST
     assert parsed_url.path.strip('/') == auth.AUTHORIZE_PATH
 
-    querystring = parsed_url.query
-    queryparams = parse_qs(querystring)
-    expected_query = EXPECTED_QUERYSTRING.format(
-        '+'.join(SCOPES),
-        auth_code_grant.state_token,
-        quote(REDIRECT_URL, safe=''),
-        auth.CODE_RESPONSE_TYPE,
-        CLIENT_ID,
+    queryparams = parse_qs(parsed_url.query)
+
+    assert queryparams == {
+        'scope': [' '.join(sorted(SCOPES))],
+        'state': [auth_code_grant.state_token],
+        'redirect_uri': [REDIRECT_URL],
+        'response_type': [auth.CODE_RESPONSE_TYPE],
+        'client_id': [CLIENT_ID],
+    }
+
+
+def test_auth_code_grant_authorization_url_follows_state_token(
+    auth_code_grant,
+):
+    """Test authorization url is reused until the state token changes."""
+    url = auth_code_grant.get_authorization_url()
+    assert auth_code_grant.get_authorization_url() is url
+
+    auth_code_grant.state_token = STATE_TOKEN
+    url = auth_code_grant.get_authorization_url()
+    queryparams = parse_qs(urlparse(url).query)
+    assert queryparams['state'] == [STATE_TOKEN]
+
+
+def test_implicit_grant_authorization_url_follows_credentials():
+    """Test authorization url is rebuilt when client_id or scopes change."""
+    implicit_grant = ImplicitGrant(
+        client_id=CLIENT_ID,
+        scopes=SCOPES,
+        redirect_url=REDIRECT_URL,
     )
+    implicit_grant.get_authorization_url()
 
-    assert expected_query in querystring
-    assert queryparams.get('scope')[0] == ' '.join(SCOPES)
-    assert queryparams.get('redirect_uri')[0] == REDIRECT_URL
-    assert queryparams.get('response_type')[0] == auth.CODE_RESPONSE_TYPE
-    assert queryparams.get('client_id')[0] == CLIENT_ID
-    assert queryparams.get('state')[0] == auth_code_grant.state_token
+    implicit_grant.client_id = 'other'
+    implicit_grant.scopes = CLIENT_CREDENTIALS_SCOPES
+    url = implicit_grant.get_authorization_url()
+
+    queryparams = parse_qs(urlparse(url).query)
+    assert queryparams['client_id'] == ['other']
+    scope = ' '.join(sorted(CLIENT_CREDENTIALS_SCOPES))
+    assert queryparams['scope'] == [scope]
 
 
 @uber_vcr.use_cassette()
 def test_auth_code_get_session(auth_code_grant):
     """Test to get OAuth 2.0 session for authorization code grant."""
     auth_code_grant.state_token = STATE_TOKEN
-    redirect_url = '{}?state={}&code={}'
-    redirect_url = redirect_url.format(
-        REDIRECT_URL,
-        STATE_TOKEN,
-        AUTHORIZATION_CODE,
+    redirect_url = (
+        f'{REDIRECT_URL}?state={STATE_TOKEN}&code={AUTHORIZATION_CODE}'
     )
     session = auth_code_grant.get_session(redirect_url)
 
@@ -210,30 +219,23 @@ def test_implicit_grant_get_authorization_url(implicit_grant):
     assert parsed_url.netloc == auth.AUTH_HOST
     assert parsed_url.path.strip('/') == auth.AUTHORIZE_PATH
 
-    querystring = parsed_url.query
-    queryparams = parse_qs(querystring)
-    expected_query = EXPECTED_QUERYSTRING.format(
-        '+'.join(SCOPES),
-        None,
-        quote(REDIRECT_URL, safe=''),
-        auth.TOKEN_RESPONSE_TYPE,
-        CLIENT_ID,
-    )
+    queryparams = parse_qs(parsed_url.query)
 
-    assert expected_query in querystring
-    assert queryparams.get('scope')[0] == ' '.join(SCOPES)
-    assert queryparams.get('redirect_uri')[0] == REDIRECT_URL
-    assert queryparams.get('response_type')[0] == auth.TOKEN_RESPONSE_TYPE
-    assert queryparams.get('client_id')[0] == CLIENT_ID
+    assert queryparams == {
+        'scope': [' '.join(sorted(SCOPES))],
+        'state': ['None'],
+        'redirect_uri': [REDIRECT_URL],
+        'response_type': [auth.TOKEN_RESPONSE_TYPE],
+        'client_id': [CLIENT_ID],
+    }
 
 
 def test_implicit_grant_get_session(implicit_grant):
     """Test to get OAuth 2.0 session from URL for implicit grant."""
     redirect_url = (
-        '{}#access_token={}&token_type=Bearer&state=None'
-        '&expires_in=2592000&scope=profile+history'
+        f'{REDIRECT_URL}#access_token={ACCESS_TOKEN}&token_type=Bearer'
+        '&state=None&expires_in=2592000&scope=profile+history'
     )
-    redirect_url = redirect_url.format(REDIRECT_URL, ACCESS_TOKEN)
     session = implicit_grant.get_session(redirect_url)
 
     assert session.server_token is None
@@ -290,3 +292,18 @@ def test_refresh_client_credential_access_token(
     assert credential.client_secret == CLIENT_SECRET
     assert credential.redirect_url is None
     assert credential.refresh_token is None
+
+
+def test_request_access_token_joins_frozenset_scopes():
+    """Test that immutable scope sets are sent space delimited."""
+    with patch('uber_rides.auth.post') as post:
+        post.return_value = Mock(status_code=200)
+        _request_access_token(
+            grant_type=auth.CLIENT_CREDENTIALS_GRANT,
+            client_id=CLIENT_ID,
+            client_secret=CLIENT_SECRET,
+            scopes=SCOPES,
+        )
+
+    scope = post.call_args[1]['data']['scope']
+    assert set(scope.split(' ')) == SCOPES
@@ -18,16 +18,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
-from mock import Mock
 from pytest import fixture
 from pytest import raises
 from requests import codes
 
+from tests.fake_response import FakeResponse
 from tests.vcr_config import uber_vcr
 from uber_rides.client import SurgeError
 from uber_rides.client import UberRidesClient
@@ -48,24 +43,24 @@ ACCESS_TOKEN = 'xxx'
 REFRESH_TOKEN = 'xxx'
 REDIRECT_URL = 'http://localhost:8000/uber/connect'
 
-RIDER_SCOPES = {
-          'profile',
-          'places',
-          'request',
-          'request_receipt',
-          'all_trips',
-          'history'
-          }
-
-DRIVER_SCOPES = {
-          'partner.accounts',
-          'partner.trips',
-          'partner.payments'
-          }
-
-BUSINESS_SCOPES = {
-          'business.receipts',
-}
+RIDER_SCOPES = frozenset([
+    'profile',
+    'places',
+    'request',
+    'request_receipt',
+    'all_trips',
+    'history',
+])
+
+DRIVER_SCOPES = frozenset([
+    'partner.accounts',
+    'partner.trips',
+    'partner.payments',
+])
+
+BUSINESS_SCOPES = frozenset([
+    'business.receipts',
+])
 
 # replace these with valid identifiers to rerecord request-related fixtures
 RIDE_ID = '0aec0061-1e20-4239-a0b7-78328e9afec8'
@@ -103,10 +98,12 @@ NON_UFP_SURGE_START_LNG = -43.1801978
 NON_UFP_SURGE_END_LAT = -22.9883286
 NON_UFP_SURGE_END_LNG = -43.1925661
 SURGE_HREF = 'api.uber.com/v1.2/surge-confirmations/{}'
+SURGE_URL = SURGE_HREF.format(SURGE_ID)
+SURGE_DESCRIPTION = http.ERROR_CODE_DESCRIPTION_DICT['surge']
 
 BUSINESS_TRIP_ID = '5152dcc5-b88d-4754-8b33-975f4067c942'
 
-EXPECTED_PRODUCT_KEYS = set([
+EXPECTED_PRODUCT_KEYS = frozenset([
     'capacity',
     'description',
     'image',
@@ -119,14 +116,14 @@ EXPECTED_PRODUCT_KEYS = set([
     'upfront_fare_enabled'
 ])
 
-EXPECTED_TIME_KEYS = set([
+EXPECTED_TIME_KEYS = frozenset([
     'localized_display_name',
     'estimate',
     'display_name',
     'product_id'
 ])
 
-EXPECTED_PRICE_KEYS = set([
+EXPECTED_PRICE_KEYS = frozenset([
     'high_estimate',
     'low_estimate',
     'currency_code',
@@ -138,13 +135,13 @@ EXPECTED_PRICE_KEYS = set([
     'product_id'
 ])
 
-EXPECTED_PROMOTION_KEYS = set([
+EXPECTED_PROMOTION_KEYS = frozenset([
     'display_text',
     'localized_value',
     'type'
 ])
 
-EXPECTED_ACTIVITY_KEYS = set([
+EXPECTED_ACTIVITY_KEYS = frozenset([
     'status',
     'distance',
     'start_time',
@@ -154,7 +151,7 @@ EXPECTED_ACTIVITY_KEYS = set([
     'product_id'
 ])
 
-EXPECTED_PROFILE_KEYS = set([
+EXPECTED_PROFILE_KEYS = frozenset([
     'picture',
     'first_name',
     'last_name',
@@ -163,7 +160,7 @@ EXPECTED_PROFILE_KEYS = set([
     'promo_code'
 ])
 
-EXPECTED_ESTIMATE_RIDE_FARE_KEYS = set([
+EXPECTED_ESTIMATE_RIDE_FARE_KEYS = frozenset([
     'value',
     'fare_id',
     'expires_at',
@@ -171,19 +168,19 @@ EXPECTED_ESTIMATE_RIDE_FARE_KEYS = set([
     'display'
 ])
 
-EXPECTED_ESTIMATE_RIDE_TRIP_KEYS = set([
+EXPECTED_ESTIMATE_RIDE_TRIP_KEYS = frozenset([
     'distance_unit',
     'duration_estimate',
     'distance_estimate'
 ])
 
-EXPECTED_ESTIMATE_SHARED_RIDE_TRIP_KEYS = set([
+EXPECTED_ESTIMATE_SHARED_RIDE_TRIP_KEYS = frozenset([
     'distance_unit',
     'duration_estimate',
     'distance_estimate'
 ])
 
-EXPECTED_RIDE_DETAILS_KEYS = set([
+EXPECTED_RIDE_DETAILS_KEYS = frozenset([
     'status',
     'request_id',
     'product_id',
@@ -195,7 +192,7 @@ EXPECTED_RIDE_DETAILS_KEYS = set([
     'shared'
 ])
 
-EXPECTED_SHARED_RIDE_DETAILS_KEYS = set([
+EXPECTED_SHARED_RIDE_DETAILS_KEYS = frozenset([
     'status',
     'request_id',
     'product_id',
@@ -207,18 +204,18 @@ EXPECTED_SHARED_RIDE_DETAILS_KEYS = set([
     'shared'
 ])
 
-EXPECTED_RIDE_MAP_KEYS = set([
+EXPECTED_RIDE_MAP_KEYS = frozenset([
     'href',
     'request_id'
 ])
 
-EXPECTED_INDIVIDUAL_CHARGE_KEYS = set([
+EXPECTED_INDIVIDUAL_CHARGE_KEYS = frozenset([
     'amount',
     'type',
     'name'
 ])
 
-EXPECTED_RECEIPT_KEYS = set([
+EXPECTED_RECEIPT_KEYS = frozenset([
     'distance',
     'charge_adjustments',
     'total_owed',
@@ -230,15 +227,15 @@ EXPECTED_RECEIPT_KEYS = set([
     'subtotal'
 ])
 
-EXPECTED_PLACE_KEYS = set(['address'])
+EXPECTED_PLACE_KEYS = frozenset(['address'])
 
-EXPECTED_PAYMENT_KEYS = set([
+EXPECTED_PAYMENT_KEYS = frozenset([
     'payment_method_id',
     'type',
     'description'
 ])
 
-EXPECTED_DRIVER_PROFILE_KEYS = set([
+EXPECTED_DRIVER_PROFILE_KEYS = frozenset([
     'driver_id',
     'activation_status',
     'first_name',
@@ -251,7 +248,7 @@ EXPECTED_DRIVER_PROFILE_KEYS = set([
     'rating'
 ])
 
-EXPECTED_DRIVER_TRIPS_KEYS = set([
+EXPECTED_DRIVER_TRIPS_KEYS = frozenset([
     'dropoff',
     'distance',
     'status_changes',
@@ -261,7 +258,7 @@ EXPECTED_DRIVER_TRIPS_KEYS = set([
     'trip_id'
 ])
 
-EXPECTED_DRIVER_PAYMENTS_KEYS = set([
+EXPECTED_DRIVER_PAYMENTS_KEYS = frozenset([
     'category',
     'breakdown',
     'rider_fees',
@@ -274,7 +271,7 @@ EXPECTED_DRIVER_PAYMENTS_KEYS = set([
     'currency_code'
 ])
 
-EXPECTED_BUSINESS_TRIP_RECEIPT_KEYS = set([
+EXPECTED_BUSINESS_TRIP_RECEIPT_KEYS = frozenset([
     'given_name',
     'family_name',
     'email',
@@ -289,20 +286,20 @@ EXPECTED_BUSINESS_TRIP_RECEIPT_KEYS = set([
     'expense_memo'
 ])
 
-EXPECTED_BUSINESS_TRIP_RECEIPT_PDF_KEYS = set([
+EXPECTED_BUSINESS_TRIP_RECEIPT_PDF_KEYS = frozenset([
     'trip_uuid',
     'organization_uuid',
     'resource_url'
 ])
 
-EXPECTED_BUSINESS_TRIP_INVOICE_URLS_KEYS = set([
+EXPECTED_BUSINESS_TRIP_INVOICE_URLS_KEYS = frozenset([
     'trip_uuid',
     'organization_uuid',
     'invoices'
 ])
 
 
-@fixture
+@fixture(scope='module')
 def rider_oauth2credential():
     """Create OAuth2Credential class to hold access token information."""
     return OAuth2Credential(
@@ -317,7 +314,7 @@ def rider_oauth2credential():
     )
 
 
-@fixture
+@fixture(scope='module')
 def driver_oauth2credential():
     """Create OAuth2Credential class to hold access token information."""
     return OAuth2Credential(
@@ -332,7 +329,7 @@ def driver_oauth2credential():
     )
 
 
-@fixture
+@fixture(scope='module')
 def business_oauth2credential():
     """Create OAuth2Credential class to hold access token information."""
     return OAuth2Credential(
@@ -345,61 +342,71 @@ def business_oauth2credential():
     )
 
 
-@fixture
+@fixture(scope='module')
 def authorized_rider_sandbox_client(rider_oauth2credential):
     """Create an UberRidesClient in Sandbox Mode with OAuth 2.0 Credentials."""
     session = Session(oauth2credential=rider_oauth2credential)
     return UberRidesClient(session, sandbox_mode=True)
 
 
-@fixture
+@fixture(scope='module')
 def authorized_rider_production_client(rider_oauth2credential):
     """Create an UberRidesClient in Production with OAuth 2.0 Credentials."""
     session = Session(oauth2credential=rider_oauth2credential)
     return UberRidesClient(session)
 
 
-@fixture
+@fixture(scope='module')
 def authorized_business_production_client(business_oauth2credential):
     """Create an UberRidesClient in Production with OAuth 2.0 Credentials."""
     session = Session(oauth2credential=business_oauth2credential)
     return UberRidesClient(session)
 
 
-@fixture
+@fixture(scope='module')
 def authorized_driver_sandbox_client(driver_oauth2credential):
     """Create an UberRidesClient in Sandbox Mode with OAuth 2.0 Credentials."""
     session = Session(oauth2credential=driver_oauth2credential)
     return UberRidesClient(session, sandbox_mode=True)
 
 
-@fixture
+@fixture(scope='module')
 def authorized_driver_production_client(driver_oauth2credential):
     """Create an UberRidesClient in Production with OAuth 2.0 Credentials."""
     session = Session(oauth2credential=driver_oauth2credential)
     return UberRidesClient(session)
 
 
-@fixture
+@fixture(scope='module')
 def server_token_client():
     """Create an UberRidesClient with Server Token."""
     session = Session(server_token=SERVER_TOKEN)
     return UberRidesClient(session)
 
 
-@fixture
+@fixture(params=[
+    'authorized_rider_sandbox_client',
+    'server_token_client',
+])
+def any_client(request):
+    """Run a test once with an access token and once with a server token."""
+    return request.getfixturevalue(request.param)
+
+
+def _assert_shape(expected_keys, obj):
+    """Assert that a response dict contains every expected key."""
+    missing = expected_keys - obj.keys()
+    assert not missing, 'missing keys: {}'.format(sorted(missing))
+
+
+@fixture(scope='module')
 def http_surge_error():
     code = 'surge'
 
-    mock_error = Mock(
-        status_code=http.STATUS_CONFLICT,
-        headers=http.DEFAULT_CONTENT_HEADERS,
-    )
-
     error_response = {
         'meta': {
             'surge_confirmation': {
-                'href': SURGE_HREF.format(SURGE_ID),
+                'href': SURGE_URL,
                 'surge_confirmation_id': SURGE_ID,
             },
         },
@@ -407,120 +414,97 @@ def http_surge_error():
             {
                 'status': http.STATUS_CONFLICT,
                 'code': code,
-                'title': http.ERROR_CODE_DESCRIPTION_DICT[code],
+                'title': SURGE_DESCRIPTION,
             },
         ],
     }
 
-    mock_error.json = Mock(return_value=error_response)
-    return mock_error
+    return FakeResponse(http.STATUS_CONFLICT, error_response)
 
 
 @uber_vcr.use_cassette()
-def test_get_products(authorized_rider_sandbox_client, server_token_client):
+def test_get_products(any_client):
     """Test to fetch products with access token and server token."""
-    clients = [authorized_rider_sandbox_client, server_token_client]
-
-    for client in clients:
-        response = client.get_products(START_LAT, START_LNG)
-        assert response.status_code == codes.ok
+    response = any_client.get_products(START_LAT, START_LNG)
+    assert response.status_code == codes.ok
 
-        # assert response looks like products information
-        response = response.json
-        products = response.get('products')
-        assert len(products) >= PRODUCTS_AVAILABLE
-        assert isinstance(products, list)
+    # assert response looks like products information
+    response = response.json
+    products = response.get('products')
+    assert len(products) >= PRODUCTS_AVAILABLE
+    assert isinstance(products, list)
 
-        for product in products:
-            assert EXPECTED_PRODUCT_KEYS.issubset(product)
+    for product in products:
+        _assert_shape(EXPECTED_PRODUCT_KEYS, product)
 
 
 @uber_vcr.use_cassette()
-def test_get_single_product(authorized_rider_sandbox_client,
-                            server_token_client
-                            ):
+def test_get_single_product(any_client):
     """Test fetch product by ID with access token and server token."""
-    clients = [authorized_rider_sandbox_client, server_token_client]
-
-    for client in clients:
-        response = client.get_product(UFP_PRODUCT_ID)
-        assert response.status_code == codes.ok
+    response = any_client.get_product(UFP_PRODUCT_ID)
+    assert response.status_code == codes.ok
 
-        # assert response looks like single product information
-        response = response.json
-        assert 'products' not in response
-        assert EXPECTED_PRODUCT_KEYS.issubset(response)
+    # assert response looks like single product information
+    response = response.json
+    assert 'products' not in response
+    _assert_shape(EXPECTED_PRODUCT_KEYS, response)
 
 
 @uber_vcr.use_cassette()
-def test_get_price_estimates(authorized_rider_sandbox_client,
-                             server_token_client
-                             ):
+def test_get_price_estimates(any_client):
     """Test to fetch price estimates with access token and server token."""
-    clients = [authorized_rider_sandbox_client, server_token_client]
-
-    for client in clients:
-        response = client.get_price_estimates(
-            START_LAT,
-            START_LNG,
-            END_LAT,
-            END_LNG,
-            UFP_SHARED_SEAT_COUNT,
-        )
-        assert response.status_code == codes.ok
+    response = any_client.get_price_estimates(
+        START_LAT,
+        START_LNG,
+        END_LAT,
+        END_LNG,
+        UFP_SHARED_SEAT_COUNT,
+    )
+    assert response.status_code == codes.ok
 
-        # assert response looks like price estimates
-        response = response.json
-        prices = response.get('prices')
-        assert len(prices) >= PRODUCTS_AVAILABLE
-        assert isinstance(prices, list)
+    # assert response looks like price estimates
+    response = response.json
+    prices = response.get('prices')
+    assert len(prices) >= PRODUCTS_AVAILABLE
+    assert isinstance(prices, list)
 
-        for price in prices:
-            assert EXPECTED_PRICE_KEYS.issubset(price)
+    for price in prices:
+        _assert_shape(EXPECTED_PRICE_KEYS, price)
 
 
 @uber_vcr.use_cassette()
-def test_get_pickup_time_estimates(
-    authorized_rider_sandbox_client,
-    server_token_client,
-):
+def test_get_pickup_time_estimates(any_client):
     """Test to fetch time estimates with access token and server token."""
-    clients = [authorized_rider_sandbox_client, server_token_client]
-
-    for client in clients:
-        response = client.get_pickup_time_estimates(
-            START_LAT,
-            START_LNG,
-        )
-        assert response.status_code == codes.ok
+    response = any_client.get_pickup_time_estimates(
+        START_LAT,
+        START_LNG,
+    )
+    assert response.status_code == codes.ok
 
-        # assert response looks like pickup time estimates
-        response = response.json
-        times = response.get('times')
-        assert len(times) >= PRODUCTS_AVAILABLE
-        assert isinstance(times, list)
+    # assert response looks like pickup time estimates
+    response = response.json
+    times = response.get('times')
+    assert len(times) >= PRODUCTS_AVAILABLE
+    assert isinstance(times, list)
 
-        for pickup_time in times:
-            assert EXPECTED_TIME_KEYS.issubset(pickup_time)
+    for pickup_time in times:
+        _assert_shape(EXPECTED_TIME_KEYS, pickup_time)
 
 
 @uber_vcr.use_cassette()
-def test_get_promotions(authorized_rider_sandbox_client, server_token_client):
+def test_get_promotions(any_client):
     """Test to fetch promotions with access token and server token."""
-    clients = [authorized_rider_sandbox_client, server_token_client]
-
-    for client in clients:
-        response = client.get_promotions(
-            START_LAT,
-            START_LNG,
-            END_LAT,
-            END_LNG,
-        )
-        assert response.status_code == codes.ok
+    response = any_client.get_promotions(
+        START_LAT,
+        START_LNG,
+        END_LAT,
+        END_LNG,
+    )
+    assert response.status_code == codes.ok
 
-        # assert response looks like promotions
-        response = response.json
-        assert EXPECTED_PROMOTION_KEYS.issubset(response)
+    # assert response looks like promotions
+    response = response.json
+    _assert_shape(EXPECTED_PROMOTION_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -536,7 +520,7 @@ def test_get_user_activity(authorized_rider_sandbox_client):
     assert isinstance(history, list)
 
     for activity in history:
-        assert EXPECTED_ACTIVITY_KEYS.issubset(activity)
+        _assert_shape(EXPECTED_ACTIVITY_KEYS, activity)
 
 
 @uber_vcr.use_cassette()
@@ -552,7 +536,7 @@ def test_get_rider_trips(authorized_rider_sandbox_client):
     assert isinstance(trips, list)
 
     for trip in trips:
-        assert EXPECTED_ACTIVITY_KEYS.issubset(trip)
+        _assert_shape(EXPECTED_ACTIVITY_KEYS, trip)
 
 
 @uber_vcr.use_cassette()
@@ -563,7 +547,7 @@ def test_get_user_profile(authorized_rider_sandbox_client):
 
     # assert response looks like user profile
     response = response.json
-    assert EXPECTED_PROFILE_KEYS.issubset(response)
+    _assert_shape(EXPECTED_PROFILE_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -574,7 +558,7 @@ def test_get_rider_profile(authorized_rider_sandbox_client):
 
     # assert response looks like user profile
     response = response.json
-    assert EXPECTED_PROFILE_KEYS.issubset(response)
+    _assert_shape(EXPECTED_PROFILE_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -596,9 +580,9 @@ def test_estimate_shared_ride(authorized_rider_sandbox_client):
     # assert response looks like price and time estimates
     response = response.json
     fare = response.get('fare')
-    assert EXPECTED_ESTIMATE_RIDE_FARE_KEYS.issubset(fare)
+    _assert_shape(EXPECTED_ESTIMATE_RIDE_FARE_KEYS, fare)
     trip = response.get('trip')
-    assert EXPECTED_ESTIMATE_SHARED_RIDE_TRIP_KEYS.issubset(trip)
+    _assert_shape(EXPECTED_ESTIMATE_SHARED_RIDE_TRIP_KEYS, trip)
 
 
 @uber_vcr.use_cassette()
@@ -616,9 +600,9 @@ def test_estimate_ride(authorized_rider_sandbox_client):
     # assert response looks like price and time estimates
     response = response.json
     fare = response.get('fare')
-    assert EXPECTED_ESTIMATE_RIDE_FARE_KEYS.issubset(fare)
+    _assert_shape(EXPECTED_ESTIMATE_RIDE_FARE_KEYS, fare)
     trip = response.get('trip')
-    assert EXPECTED_ESTIMATE_RIDE_TRIP_KEYS.issubset(trip)
+    _assert_shape(EXPECTED_ESTIMATE_RIDE_TRIP_KEYS, trip)
 
 
 @uber_vcr.use_cassette()
@@ -634,9 +618,9 @@ def test_estimate_ride_with_places(authorized_rider_sandbox_client):
     # assert response looks like price and time estimates
     response = response.json
     fare = response.get('fare')
-    assert EXPECTED_ESTIMATE_RIDE_FARE_KEYS.issubset(fare)
+    _assert_shape(EXPECTED_ESTIMATE_RIDE_FARE_KEYS, fare)
     trip = response.get('trip')
-    assert EXPECTED_ESTIMATE_RIDE_TRIP_KEYS.issubset(trip)
+    _assert_shape(EXPECTED_ESTIMATE_RIDE_TRIP_KEYS, trip)
 
 
 @uber_vcr.use_cassette()
@@ -654,7 +638,7 @@ def test_request_ride(authorized_rider_sandbox_client):
 
     # assert response looks like ride details
     response = response.json
-    assert EXPECTED_RIDE_DETAILS_KEYS.issubset(response)
+    _assert_shape(EXPECTED_RIDE_DETAILS_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -690,7 +674,7 @@ def test_request_ride_with_no_default_product(authorized_rider_sandbox_client):
 
     # assert response looks like ride details
     response = response.json
-    assert EXPECTED_RIDE_DETAILS_KEYS.issubset(response)
+    _assert_shape(EXPECTED_RIDE_DETAILS_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -706,7 +690,7 @@ def test_request_ride_with_places(authorized_rider_sandbox_client):
 
     # assert response looks like ride details
     response = response.json
-    assert EXPECTED_RIDE_DETAILS_KEYS.issubset(response)
+    _assert_shape(EXPECTED_RIDE_DETAILS_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -717,7 +701,7 @@ def test_get_ride_details(authorized_rider_sandbox_client):
 
     # assert response looks like ride details
     response = response.json
-    assert EXPECTED_RIDE_DETAILS_KEYS.issubset(response)
+    _assert_shape(EXPECTED_RIDE_DETAILS_KEYS, response)
     assert response.get('status') == 'processing'
 
 
@@ -729,7 +713,7 @@ def test_get_current_ride_details(authorized_rider_sandbox_client):
 
     # assert response looks like ride details
     response = response.json
-    assert EXPECTED_RIDE_DETAILS_KEYS.issubset(response)
+    _assert_shape(EXPECTED_RIDE_DETAILS_KEYS, response)
     assert response.get('status') == 'processing'
 
 
@@ -741,7 +725,7 @@ def test_get_current_shared_ride_details(authorized_rider_sandbox_client):
 
     # assert response looks like ride details
     response = response.json
-    assert EXPECTED_SHARED_RIDE_DETAILS_KEYS.issubset(response)
+    _assert_shape(EXPECTED_SHARED_RIDE_DETAILS_KEYS, response)
     assert response.get('status') == 'processing'
 
 
@@ -774,7 +758,7 @@ def test_get_ride_map(authorized_rider_sandbox_client):
 
     # assert response looks like map
     response = response.json
-    assert EXPECTED_RIDE_MAP_KEYS.issubset(response)
+    _assert_shape(EXPECTED_RIDE_MAP_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -809,11 +793,11 @@ def test_get_ride_receipt(authorized_rider_sandbox_client):
 
     # assert response looks like ride receipt
     response = response.json
-    assert EXPECTED_RECEIPT_KEYS.issubset(response)
+    _assert_shape(EXPECTED_RECEIPT_KEYS, response)
     charges = response.get('charge_adjustments')
 
     for charge in charges:
-        assert EXPECTED_INDIVIDUAL_CHARGE_KEYS.issubset(charge)
+        _assert_shape(EXPECTED_INDIVIDUAL_CHARGE_KEYS, charge)
 
 
 @uber_vcr.use_cassette()
@@ -848,16 +832,14 @@ def test_surge_error_formation(http_surge_error):
     assert isinstance(surge_error.meta, dict)
 
     error_details = surge_error.errors[0]
-    expected_code = 'surge'
-    expected_description = http.ERROR_CODE_DESCRIPTION_DICT[expected_code]
 
     assert isinstance(error_details, ErrorDetails)
     assert error_details.status == http.STATUS_CONFLICT
-    assert error_details.code == expected_code
-    assert error_details.title == expected_description
+    assert error_details.code == 'surge'
+    assert error_details.title == SURGE_DESCRIPTION
 
     assert surge_error.surge_confirmation_id == SURGE_ID
-    assert surge_error.surge_confirmation_href == SURGE_HREF.format(SURGE_ID)
+    assert surge_error.surge_confirmation_href == SURGE_URL
 
 
 @uber_vcr.use_cassette()
@@ -868,7 +850,7 @@ def test_set_home_address(authorized_rider_sandbox_client):
 
     # assert response looks like places details
     response = response.json
-    assert EXPECTED_PLACE_KEYS.issubset(response)
+    _assert_shape(EXPECTED_PLACE_KEYS, response)
     assert response.get('address') == FULL_HOME_ADDRESS
 
 
@@ -880,7 +862,7 @@ def test_get_home_address(authorized_rider_sandbox_client):
 
     # assert response looks like places details
     response = response.json
-    assert EXPECTED_PLACE_KEYS.issubset(response)
+    _assert_shape(EXPECTED_PLACE_KEYS, response)
     assert response.get('address') == FULL_HOME_ADDRESS
 
 
@@ -892,7 +874,7 @@ def test_set_work_address(authorized_rider_sandbox_client):
 
     # assert response looks like places details
     response = response.json
-    assert EXPECTED_PLACE_KEYS.issubset(response)
+    _assert_shape(EXPECTED_PLACE_KEYS, response)
     assert response.get('address') == FULL_WORK_ADDRESS
 
 
@@ -904,7 +886,7 @@ def test_get_work_address(authorized_rider_sandbox_client):
 
     # assert response looks like places details
     response = response.json
-    assert EXPECTED_PLACE_KEYS.issubset(response)
+    _assert_shape(EXPECTED_PLACE_KEYS, response)
     assert response.get('address') == FULL_WORK_ADDRESS
 
 
@@ -918,7 +900,7 @@ def test_get_payment_methods(authorized_rider_sandbox_client):
     payments = response.get('payment_methods')
 
     for payment in payments:
-        assert EXPECTED_PAYMENT_KEYS.issubset(payment)
+        _assert_shape(EXPECTED_PAYMENT_KEYS, payment)
 
 
 @uber_vcr.use_cassette()
@@ -929,7 +911,7 @@ def test_get_driver_profile(authorized_driver_production_client):
 
     # assert response looks like driver profile
     response = response.json
-    assert EXPECTED_DRIVER_PROFILE_KEYS.issubset(response)
+    _assert_shape(EXPECTED_DRIVER_PROFILE_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -942,7 +924,7 @@ def test_get_driver_trips(authorized_driver_production_client):
     trips = response.get('trips')
 
     for trip in trips:
-        assert EXPECTED_DRIVER_TRIPS_KEYS.issubset(trip)
+        _assert_shape(EXPECTED_DRIVER_TRIPS_KEYS, trip)
 
 
 @uber_vcr.use_cassette()
@@ -955,7 +937,7 @@ def test_get_driver_payments(authorized_driver_production_client):
     payments = response.get('payments')
 
     for payment in payments:
-        assert EXPECTED_DRIVER_PAYMENTS_KEYS.issubset(payment)
+        _assert_shape(EXPECTED_DRIVER_PAYMENTS_KEYS, payment)
 
 
 @uber_vcr.use_cassette()
@@ -967,7 +949,7 @@ def test_get_business_receipt(authorized_business_production_client):
 
     response = response.json
 
-    assert EXPECTED_BUSINESS_TRIP_RECEIPT_KEYS.issubset(response)
+    _assert_shape(EXPECTED_BUSINESS_TRIP_RECEIPT_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -980,7 +962,7 @@ def test_get_business_trip_receipt_pdf_url(
 
     response = response.json
 
-    assert EXPECTED_BUSINESS_TRIP_RECEIPT_PDF_KEYS.issubset(response)
+    _assert_shape(EXPECTED_BUSINESS_TRIP_RECEIPT_PDF_KEYS, response)
 
 
 @uber_vcr.use_cassette()
@@ -992,7 +974,7 @@ def test_get_business_trip_invoice_urls(authorized_business_production_client):
 
     response = response.json
 
-    assert EXPECTED_BUSINESS_TRIP_INVOICE_URLS_KEYS.issubset(response)
+    _assert_shape(EXPECTED_BUSINESS_TRIP_INVOICE_URLS_KEYS, response)
 
 
 @uber_vcr.use_cassette()
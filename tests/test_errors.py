@@ -18,47 +18,46 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
+from types import MappingProxyType
 
-from mock import Mock
 from pytest import fixture
+from pytest import mark
 
+from tests.fake_response import FakeResponse
 from uber_rides.errors import ClientError
 from uber_rides.errors import ErrorDetails
 from uber_rides.errors import ServerError
 from uber_rides.utils import http
 
 
-@fixture
+DISTANCE_EXCEEDED_DESCRIPTION = (
+    http.ERROR_CODE_DESCRIPTION_DICT['distance_exceeded']
+)
+
+# every coordinate of a too-long trip is rejected with the same description;
+# read-only because the fixture payload and the expected meta share it
+DISTANCE_EXCEEDED_FIELDS = MappingProxyType(dict.fromkeys(
+    ('start_longitude', 'end_longitude', 'start_latitude', 'end_latitude'),
+    DISTANCE_EXCEEDED_DESCRIPTION,
+))
+
+
+@fixture(scope='module')
 def simple_401_error():
     code = 'unauthorized'
 
-    mock_error = Mock(
-        status_code=http.STATUS_UNAUTHORIZED,
-        headers=http.DEFAULT_CONTENT_HEADERS,
-    )
-
     error_response = {
         'message': http.ERROR_CODE_DESCRIPTION_DICT[code],
         'code': code,
     }
 
-    mock_error.json = Mock(return_value=error_response)
-    return mock_error
+    return FakeResponse(http.STATUS_UNAUTHORIZED, error_response)
 
 
-@fixture
+@fixture(scope='module')
 def simple_422_validation_error():
     code = 'validation_failed'
 
-    mock_error = Mock(
-        status_code=http.STATUS_UNPROCESSABLE_ENTITY,
-        headers=http.DEFAULT_CONTENT_HEADERS,
-    )
-
     error_response = {
         'fields': {
             'latitude': 'Must be between -90.0 and 90.0',
@@ -68,79 +67,50 @@ def simple_422_validation_error():
         'code': code,
     }
 
-    mock_error.json = Mock(return_value=error_response)
-    return mock_error
+    return FakeResponse(http.STATUS_UNPROCESSABLE_ENTITY, error_response)
 
 
-@fixture
+@fixture(scope='module')
 def simple_422_distance_exceeded_error():
     code = 'distance_exceeded'
 
-    mock_error = Mock(
-        status_code=http.STATUS_UNPROCESSABLE_ENTITY,
-        headers=http.DEFAULT_CONTENT_HEADERS,
-    )
-
     error_response = {
-        'fields': {
-            'start_longitude': http.ERROR_CODE_DESCRIPTION_DICT[code],
-            'end_longitude': http.ERROR_CODE_DESCRIPTION_DICT[code],
-            'start_latitude': http.ERROR_CODE_DESCRIPTION_DICT[code],
-            'end_latitude': http.ERROR_CODE_DESCRIPTION_DICT[code],
-        },
-        'message': http.ERROR_CODE_DESCRIPTION_DICT[code],
+        'fields': DISTANCE_EXCEEDED_FIELDS,
+        'message': DISTANCE_EXCEEDED_DESCRIPTION,
         'code': code,
     }
 
-    mock_error.json = Mock(return_value=error_response)
-    return mock_error
+    return FakeResponse(http.STATUS_UNPROCESSABLE_ENTITY, error_response)
 
 
-@fixture
+@fixture(scope='module')
 def simple_500_error():
     code = 'internal_server_error'
 
-    mock_error = Mock(
-        status_code=http.STATUS_INTERNAL_SERVER_ERROR,
-        headers=http.DEFAULT_CONTENT_HEADERS,
-    )
-
     error_response = {
         'message': http.ERROR_CODE_DESCRIPTION_DICT[code],
         'code': code,
     }
 
-    mock_error.json = Mock(return_value=error_response)
-    return mock_error
+    return FakeResponse(http.STATUS_INTERNAL_SERVER_ERROR, error_response)
 
 
-@fixture
+@fixture(scope='module')
 def simple_503_error():
     code = 'service_unavailable'
 
-    mock_error = Mock(
-        status_code=http.STATUS_SERVICE_UNAVAILABLE,
-        headers=http.DEFAULT_CONTENT_HEADERS,
-    )
-
     error_response = {
         'message': http.ERROR_CODE_DESCRIPTION_DICT[code],
         'code': code,
     }
 
-    mock_error.json = Mock(return_value=error_response)
-    return mock_error
+    return FakeResponse(http.STATUS_SERVICE_UNAVAILABLE, error_response)
 
 
-@fixture
+@fixture(scope='module')
 def complex_409_surge_error():
     code = 'surge'
 
-    mock_error = Mock(
-        status_code=http.STATUS_CONFLICT,
-        headers=http.DEFAULT_CONTENT_HEADERS,
-    )
-
     error_response = {
         'meta': {
             'surge_confirmation': {
@@ -157,19 +127,13 @@ def complex_409_surge_error():
         ],
     }
 
-    mock_error.json = Mock(return_value=error_response)
-    return mock_error
+    return FakeResponse(http.STATUS_CONFLICT, error_response)
 
 
-@fixture
+@fixture(scope='module')
 def complex_422_same_pickup_dropoff_error():
     code = 'same_pickup_dropoff'
 
-    mock_error = Mock(
-        status_code=http.STATUS_UNPROCESSABLE_ENTITY,
-        headers=http.DEFAULT_CONTENT_HEADERS,
-    )
-
     error_response = {
         'meta': {},
         'errors': [
@@ -181,169 +145,107 @@ def complex_422_same_pickup_dropoff_error():
         ],
     }
 
-    mock_error.json = Mock(return_value=error_response)
-    return mock_error
-
-
-def test_simple_401_error(simple_401_error):
-    """Test Unauthorized Error converted to ClientError correctly."""
-    client_error = ClientError(simple_401_error, 'msg')
-
-    assert str(client_error) == 'msg'
-    assert isinstance(client_error.errors, list)
-    assert isinstance(client_error.meta, dict)
-    assert not client_error.meta
-
-    error_details = client_error.errors[0]
-    expected_code = 'unauthorized'
-    expected_description = http.ERROR_CODE_DESCRIPTION_DICT[expected_code]
-
-    assert isinstance(error_details, ErrorDetails)
-    assert error_details.status == http.STATUS_UNAUTHORIZED
-    assert error_details.code == expected_code
-    assert error_details.title == expected_description
-
-
-def test_simple_422_validation_error(simple_422_validation_error):
-    """Test Validation Error converted to ClientError correctly."""
-    client_error = ClientError(simple_422_validation_error, 'msg')
-
-    assert str(client_error) == 'msg'
-    assert isinstance(client_error.errors, list)
-    assert isinstance(client_error.meta, dict)
-
-    error_details = client_error.errors[0]
-    expected_code = 'validation_failed'
-    expected_description = http.ERROR_CODE_DESCRIPTION_DICT[expected_code]
-
-    assert isinstance(error_details, ErrorDetails)
-    assert error_details.status == http.STATUS_UNPROCESSABLE_ENTITY
-    assert error_details.code == expected_code
-    assert error_details.title == expected_description
-
-    meta = client_error.meta
-
-    fields = {
-        'fields': {
-            'latitude': 'Must be between -90.0 and 90.0',
-            'longitude': 'Must be between -180.0 and 180.0',
+    return FakeResponse(http.STATUS_UNPROCESSABLE_ENTITY, error_response)
+
+
+CLIENT_ERROR_CASES = (
+    (
+        'simple_401_error',
+        http.STATUS_UNAUTHORIZED,
+        'unauthorized',
+        {},
+    ),
+    (
+        'simple_422_validation_error',
+        http.STATUS_UNPROCESSABLE_ENTITY,
+        'validation_failed',
+        {
+            'fields': {
+                'latitude': 'Must be between -90.0 and 90.0',
+                'longitude': 'Must be between -180.0 and 180.0',
+            },
         },
-    }
-
-    assert meta == fields
+    ),
+    (
+        'simple_422_distance_exceeded_error',
+        http.STATUS_UNPROCESSABLE_ENTITY,
+        'distance_exceeded',
+        {'fields': DISTANCE_EXCEEDED_FIELDS},
+    ),
+    (
+        'complex_409_surge_error',
+        http.STATUS_CONFLICT,
+        'surge',
+        {
+            'surge_confirmation': {
+                'href': 'api.uber.com/v1.2/surge-confirmations/abc',
+                'surge_confirmation_id': 'abc',
+            },
+        },
+    ),
+    (
+        'complex_422_same_pickup_dropoff_error',
+        http.STATUS_UNPROCESSABLE_ENTITY,
+        'same_pickup_dropoff',
+        {},
+    ),
+)
+
+
+SERVER_ERROR_CASES = (
+    (
+        'simple_500_error',
+        http.STATUS_INTERNAL_SERVER_ERROR,
+        'internal_server_error',
+    ),
+    (
+        'simple_503_error',
+        http.STATUS_SERVICE_UNAVAILABLE,
+        'service_unavailable',
+    ),
+)
+
+
+def _assert_error_details(error_details, status, code):
+    """Check an ErrorDetails against the expected status and error code."""
+    assert isinstance(error_details, ErrorDetails)
+    assert error_details.status == status
+    assert error_details.code == code
+    assert error_details.title == http.ERROR_CODE_DESCRIPTION_DICT[code]
 
 
-def test_simple_422_distance_exceeded_error(
-    simple_422_distance_exceeded_error
-):
-    """Test Distance Exceeded Error converted to ClientError correctly."""
-    client_error = ClientError(simple_422_distance_exceeded_error, 'msg')
+@mark.parametrize(
+    'error_fixture, status, code, meta',
+    CLIENT_ERROR_CASES,
+    ids=[case[0] for case in CLIENT_ERROR_CASES],
+)
+def test_client_error(request, error_fixture, status, code, meta):
+    """Test 4XX error responses converted to ClientError correctly."""
+    client_error = ClientError(request.getfixturevalue(error_fixture), 'msg')
 
     assert str(client_error) == 'msg'
     assert isinstance(client_error.errors, list)
     assert isinstance(client_error.meta, dict)
+    assert client_error.meta == meta
 
-    error_details = client_error.errors[0]
-    expected_code = 'distance_exceeded'
-    expected_description = http.ERROR_CODE_DESCRIPTION_DICT[expected_code]
-
-    assert isinstance(error_details, ErrorDetails)
-    assert error_details.status == http.STATUS_UNPROCESSABLE_ENTITY
-    assert error_details.code == expected_code
-    assert error_details.title == expected_description
-
-    meta = client_error.meta
-
-    fields = {
-        'fields': {
-            'start_longitude': http.ERROR_CODE_DESCRIPTION_DICT[expected_code],
-            'end_longitude': http.ERROR_CODE_DESCRIPTION_DICT[expected_code],
-            'start_latitude': http.ERROR_CODE_DESCRIPTION_DICT[expected_code],
-            'end_latitude': http.ERROR_CODE_DESCRIPTION_DICT[expected_code],
-        },
-    }
-
-    assert meta == fields
-
-
-def test_simple_500_error(simple_500_error):
-    """Test Internal Server Error converted to ClientError correctly."""
-    server_error = ServerError(simple_500_error, 'msg')
-
-    assert str(server_error) == 'msg'
-    assert isinstance(server_error.meta, dict)
-    assert not server_error.meta
-
-    error_details = server_error.error   # single error instead of array
-    expected_code = 'internal_server_error'
-    expected_description = http.ERROR_CODE_DESCRIPTION_DICT[expected_code]
-
-    assert isinstance(error_details, ErrorDetails)
-    assert error_details.status == http.STATUS_INTERNAL_SERVER_ERROR
-    assert error_details.code == expected_code
-    assert error_details.title == expected_description
+    _assert_error_details(client_error.errors[0], status, code)
 
 
-def test_simple_503_error(simple_503_error):
-    """Test Service Unavailable Error converted to ClientError correctly."""
-    server_error = ServerError(simple_503_error, 'msg')
+@mark.parametrize(
+    'error_fixture, status, code',
+    SERVER_ERROR_CASES,
+    ids=[case[0] for case in SERVER_ERROR_CASES],
+)
+def test_server_error(request, error_fixture, status, code):
+    """Test 5XX error responses converted to ServerError correctly."""
+    server_error = ServerError(request.getfixturevalue(error_fixture), 'msg')
 
     assert str(server_error) == 'msg'
     assert isinstance(server_error.meta, dict)
     assert not server_error.meta
 
-    error_details = server_error.error   # single error instead of array
-    expected_code = 'service_unavailable'
-    expected_description = http.ERROR_CODE_DESCRIPTION_DICT[expected_code]
-
-    assert isinstance(error_details, ErrorDetails)
-    assert error_details.status == http.STATUS_SERVICE_UNAVAILABLE
-    assert error_details.code == expected_code
-    assert error_details.title == expected_description
-
-
-def test_complex_409_surge_error(complex_409_surge_error):
-    """Test Surge Error converted to ClientError correctly."""
-    client_error = ClientError(complex_409_surge_error, 'msg')
-
-    assert str(client_error) == 'msg'
-    assert isinstance(client_error.errors, list)
-    assert isinstance(client_error.meta, dict)
-
-    error_details = client_error.errors[0]
-    expected_code = 'surge'
-    expected_description = http.ERROR_CODE_DESCRIPTION_DICT[expected_code]
-
-    assert isinstance(error_details, ErrorDetails)
-    assert error_details.status == http.STATUS_CONFLICT
-    assert error_details.code == expected_code
-    assert error_details.title == expected_description
-
-    surge_meta = client_error.meta['surge_confirmation']
-
-    assert surge_meta['surge_confirmation_id'] == 'abc'
-    assert surge_meta['href'] == 'api.uber.com/v1.2/surge-confirmations/abc'
-
-
-def test_complex_422_same_pickup_dropoff_error(
-    complex_422_same_pickup_dropoff_error
-):
-    """Test Same Pickup-Dropoff Error converted to ClientError correctly."""
-    client_error = ClientError(complex_422_same_pickup_dropoff_error, 'msg')
-
-    assert str(client_error) == 'msg'
-    assert isinstance(client_error.errors, list)
-    assert isinstance(client_error.meta, dict)
-    assert not client_error.meta
-
-    error_details = client_error.errors[0]
-    expected_code = 'same_pickup_dropoff'
-    expected_description = http.ERROR_CODE_DESCRIPTION_DICT[expected_code]
-
-    assert isinstance(error_details, ErrorDetails)
-    assert error_details.status == http.STATUS_UNPROCESSABLE_ENTITY
-    assert error_details.code == expected_code
-    assert error_details.title == expected_description
+    # single error instead of array
+    _assert_error_details(server_error.error, status, code)
 
 
 def test_error_details_dump():
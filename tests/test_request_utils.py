@@ -18,16 +18,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
 from collections import OrderedDict
+from json import dumps
+from pytest import mark
 
-from pytest import fixture
-
+from uber_rides.utils import http
 from uber_rides.utils.request import build_url
+from uber_rides.utils.request import create_requests_session
 from uber_rides.utils.request import generate_data
 
 
@@ -38,84 +35,81 @@ DEFAULT_TARGET = 'v1.2/products'
 SPECIAL_CHAR_TARGET = 'v1.2/~products'
 DEFAULT_BASE_URL = 'https://api.uber.com/v1.2/products'
 
-
-@fixture
-def default_http_arguments_as_json():
-    return OrderedDict([
-        ('latitude', LAT),
-        ('longitude', LNG),
-    ])
+DEFAULT_HTTP_ARGUMENTS = OrderedDict([
+    ('latitude', LAT),
+    ('longitude', LNG),
+])
+# serialized the same way generate_data builds request bodies
+DEFAULT_HTTP_ARGUMENTS_AS_STRING = dumps(DEFAULT_HTTP_ARGUMENTS)
 
 
-@fixture
-def default_http_arguments_as_string():
-    return '{{"latitude": {}, "longitude": {}}}'.format(LAT, LNG)
-
-
-def test_generate_data_with_POST(
-    default_http_arguments_as_json,
-    default_http_arguments_as_string,
-):
+def test_generate_data_with_POST():
     """Assign arguments to body of request in POST."""
-    data, params = generate_data('POST', default_http_arguments_as_json)
+    data, params = generate_data('POST', DEFAULT_HTTP_ARGUMENTS)
     assert not params
-    assert data == default_http_arguments_as_string
+    assert data == DEFAULT_HTTP_ARGUMENTS_AS_STRING
 
 
-def test_generate_data_with_PATCH(
-    default_http_arguments_as_json,
-    default_http_arguments_as_string,
-):
+def test_generate_data_with_PATCH():
     """Assign arguments to body of request in PATCH."""
-    data, params = generate_data('PATCH', default_http_arguments_as_json)
+    data, params = generate_data('PATCH', DEFAULT_HTTP_ARGUMENTS)
     assert not params
-    assert data == default_http_arguments_as_string
+    assert data == DEFAULT_HTTP_ARGUMENTS_AS_STRING
 
 
-def test_generate_data_with_PUT(
-    default_http_arguments_as_json,
-    default_http_arguments_as_string,
-):
+def test_generate_data_with_PUT():
     """Assign arguments to body of request in PUT."""
-    data, params = generate_data('PUT', default_http_arguments_as_json)
+    data, params = generate_data('PUT', DEFAULT_HTTP_ARGUMENTS)
     assert not params
-    assert data == default_http_arguments_as_string
+    assert data == DEFAULT_HTTP_ARGUMENTS_AS_STRING
 
 
-def test_generate_data_with_GET(default_http_arguments_as_json):
+def test_generate_data_with_GET():
     """Assign arguments to querystring params in GET."""
-    data, params = generate_data('GET', default_http_arguments_as_json)
-    assert params == default_http_arguments_as_json
+    data, params = generate_data('GET', DEFAULT_HTTP_ARGUMENTS)
+    assert params == DEFAULT_HTTP_ARGUMENTS
     assert not data
 
 
-def test_generate_data_with_DELETE(default_http_arguments_as_json,):
+def test_generate_data_with_DELETE():
     """Assign arguments to querystring params in DELETE."""
-    data, params = generate_data('DELETE', default_http_arguments_as_json)
-    assert params == default_http_arguments_as_json
+    data, params = generate_data('DELETE', DEFAULT_HTTP_ARGUMENTS)
+    assert params == DEFAULT_HTTP_ARGUMENTS
     assert not data
 
 
-def test_build_url_no_params():
-    """Build URL with no parameters."""
-    url = build_url(HOST, DEFAULT_TARGET)
-    assert url == DEFAULT_BASE_URL
-
-
-def test_build_url_with_scheme():
-    """Build URL with https scheme."""
-    url = build_url(HOST, DEFAULT_TARGET)
-    assert url == DEFAULT_BASE_URL
-
-
-def test_build_special_char_url():
-    """Build URL special characters."""
-    url = build_url(HOST, SPECIAL_CHAR_TARGET)
-    assert url == 'https://api.uber.com/v1.2/%7Eproducts'
-
-
-def test_build_url_params(default_http_arguments_as_json):
-    """Build URL with querystring parameters."""
-    url = build_url(HOST, DEFAULT_TARGET, default_http_arguments_as_json)
-    url_with_params = '{}?latitude={}&longitude={}'
-    assert url == url_with_params.format(DEFAULT_BASE_URL, LAT, LNG)
+@mark.parametrize('host, target, params, expected', (
+    (HOST, DEFAULT_TARGET, None, DEFAULT_BASE_URL),
+    ('https://' + HOST, DEFAULT_TARGET, None, DEFAULT_BASE_URL),
+    (
+        HOST,
+        SPECIAL_CHAR_TARGET,
+        None,
+        'https://api.uber.com/v1.2/%7Eproducts',
+    ),
+    (
+        HOST,
+        DEFAULT_TARGET,
+        DEFAULT_HTTP_ARGUMENTS,
+        '{}?latitude={}&longitude={}'.format(DEFAULT_BASE_URL, LAT, LNG),
+    ),
+), ids=['no_params', 'with_scheme', 'special_char', 'params'])
+def test_build_url(host, target, params, expected):
+    """Build URL from host, target path and querystring parameters."""
+    assert build_url(host, target, params) == expected
+
+
+def test_create_requests_session_pools_connections():
+    """Mount one pooled adapter for both http and https."""
+    session = create_requests_session()
+    adapter = session.get_adapter(DEFAULT_BASE_URL)
+    assert adapter is session.get_adapter('http://api.uber.com')
+    assert adapter._pool_connections == http.DEFAULT_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == http.DEFAULT_POOL_MAXSIZE
+
+
+def test_create_requests_session_max_retries():
+    """Pass the retry policy through to the mounted adapter."""
+    session = create_requests_session(max_retries=2)
+    adapter = session.get_adapter(DEFAULT_BASE_URL)
+    assert adapter.max_retries.total == 2
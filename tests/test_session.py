@@ -18,14 +18,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
-from mock import Mock
+from copy import copy
 from pytest import fixture
+from requests import Session as RequestsSession
+from types import MappingProxyType
 
+from tests.fake_response import FakeResponse
 from uber_rides.session import OAuth2Credential
 from uber_rides.session import Session
 from uber_rides.utils import auth
@@ -44,13 +42,27 @@ REDIRECT_URL = 'https://uberapitester.com/api/v1/uber/oauth'
 EXPIRES_IN_SECONDS = 3000
 
 SCOPES_STRING = 'profile history'
-SCOPES_SET = {'profile', 'history'}
+SCOPES_SET = frozenset(('profile', 'history'))
 
 CLIENT_CREDENTIALS_SCOPES_STRING = 'partner.referrals'
-CLIENT_CREDENTIALS_SCOPES_SET = {'partner.referrals'}
+CLIENT_CREDENTIALS_SCOPES_SET = frozenset(('partner.referrals',))
+
+# token responses are only read, so every test shares the same payload
+AUTHORIZATION_CODE_RESPONSE_JSON = MappingProxyType({
+    'access_token': ACCESS_TOKEN,
+    'expires_in': EXPIRES_IN_SECONDS,
+    'scope': SCOPES_STRING,
+    'refresh_token': REFRESH_TOKEN,
+})
 
+CLIENT_CREDENTIALS_RESPONSE_JSON = MappingProxyType({
+    'access_token': ACCESS_TOKEN,
+    'expires_in': EXPIRES_IN_SECONDS,
+    'scope': CLIENT_CREDENTIALS_SCOPES_STRING,
+})
 
-@fixture
+
+@fixture(scope='module')
 def server_token_session():
     """Create a Session with Server Token."""
     return Session(
@@ -58,7 +70,7 @@ def server_token_session():
     )
 
 
-@fixture
+@fixture(scope='module')
 def authorization_code_grant_session():
     """Create a Session from Auth Code Grant Credential."""
     oauth2credential = OAuth2Credential(
@@ -75,7 +87,7 @@ def authorization_code_grant_session():
     return Session(oauth2credential=oauth2credential)
 
 
-@fixture
+@fixture(scope='module')
 def implicit_grant_session():
     """Create a Session from Implicit Grant Credential."""
     oauth2credential = OAuth2Credential(
@@ -92,7 +104,7 @@ def implicit_grant_session():
     return Session(oauth2credential=oauth2credential)
 
 
-@fixture
+@fixture(scope='module')
 def client_credential_grant_session():
     """Create a Session from Client Credential Grant."""
     oauth2credential = OAuth2Credential(
@@ -109,40 +121,26 @@ def client_credential_grant_session():
     return Session(oauth2credential=oauth2credential)
 
 
-@fixture
-def authorization_code_response():
-    """Response after Authorization Code Access Request."""
-
-    mock_response = Mock(
-        status_code=http.STATUS_OK,
-    )
+@fixture(params=[
+    'authorization_code_grant_session',
+    'implicit_grant_session',
+    'client_credential_grant_session',
+])
+def grant_session(request):
+    """Run a test once with a Session from each OAuth 2.0 grant."""
+    return request.getfixturevalue(request.param)
 
-    response_json = {
-        'access_token': ACCESS_TOKEN,
-        'expires_in': EXPIRES_IN_SECONDS,
-        'scope': SCOPES_STRING,
-        'refresh_token': REFRESH_TOKEN,
-    }
 
-    mock_response.json = Mock(return_value=response_json)
-    return mock_response
+@fixture(scope='module')
+def authorization_code_response():
+    """Response after Authorization Code Access Request."""
+    return FakeResponse(http.STATUS_OK, AUTHORIZATION_CODE_RESPONSE_JSON)
 
 
-@fixture
+@fixture(scope='module')
 def client_credentials_response():
     """Response after Client Credentials Access Request."""
-    mock_response = Mock(
-        status_code=http.STATUS_OK,
-    )
-
-    response_json = {
-        'access_token': ACCESS_TOKEN,
-        'expires_in': EXPIRES_IN_SECONDS,
-        'scope': CLIENT_CREDENTIALS_SCOPES_STRING,
-    }
-
-    mock_response.json = Mock(return_value=response_json)
-    return mock_response
+    return FakeResponse(http.STATUS_OK, CLIENT_CREDENTIALS_RESPONSE_JSON)
 
 
 def test_server_token_session_initialized(server_token_session):
@@ -150,6 +148,17 @@ def test_server_token_session_initialized(server_token_session):
     assert server_token_session.server_token == SERVER_TOKEN
     assert server_token_session.token_type == auth.SERVER_TOKEN_TYPE
     assert server_token_session.oauth2credential is None
+    assert isinstance(server_token_session.requests_session, RequestsSession)
+
+
+def test_session_initialized_with_requests_session():
+    """Confirm Session keeps the HTTP session used to send requests."""
+    requests_session = RequestsSession()
+    session = Session(
+        server_token=SERVER_TOKEN,
+        requests_session=requests_session,
+    )
+    assert session.requests_session is requests_session
 
 
 def test_oauth2_session_initialized(authorization_code_grant_session):
@@ -163,54 +172,20 @@ def test_oauth2_session_initialized(authorization_code_grant_session):
     assert oauth2.refresh_token is REFRESH_TOKEN
 
 
-def test_new_authorization_code_grant_session_is_not_stale(
-    authorization_code_grant_session,
-):
-    """Confirm that a new Session from Auth Code Grant is not stale."""
-    assert authorization_code_grant_session.server_token is None
-    assert authorization_code_grant_session.oauth2credential
-    assert authorization_code_grant_session.token_type == auth.OAUTH_TOKEN_TYPE
-    assert not authorization_code_grant_session.oauth2credential.is_stale()
-
-
-def test_new_implicit_grant_session_is_not_stale(implicit_grant_session):
-    """Confirm that a new Session from Implicit Grant is not stale."""
-    assert implicit_grant_session.server_token is None
-    assert implicit_grant_session.oauth2credential
-    assert implicit_grant_session.token_type == auth.OAUTH_TOKEN_TYPE
-    assert not implicit_grant_session.oauth2credential.is_stale()
+def test_new_grant_session_is_not_stale(grant_session):
+    """Confirm that a new Session from an OAuth 2.0 grant is not stale."""
+    assert grant_session.server_token is None
+    assert grant_session.oauth2credential
+    assert grant_session.token_type == auth.OAUTH_TOKEN_TYPE
+    assert not grant_session.oauth2credential.is_stale()
 
 
-def test_new_client_credential_session_is_not_stale(
-    client_credential_grant_session,
-):
-    """Confirm that a new Session from Client Credential Grant is not stale."""
-    assert client_credential_grant_session.server_token is None
-    assert client_credential_grant_session.oauth2credential
-    assert client_credential_grant_session.token_type == auth.OAUTH_TOKEN_TYPE
-    assert not client_credential_grant_session.oauth2credential.is_stale()
-
-
-def test_old_authorization_code_grant_session_is_stale(
-    authorization_code_grant_session
-):
-    """Confirm that an old Session from Auth Code Grant is stale."""
-    authorization_code_grant_session.oauth2credential.expires_in_seconds = 1
-    assert authorization_code_grant_session.oauth2credential.is_stale()
-
-
-def test_old_implicit_grant_session_is_stale(implicit_grant_session):
-    """Confirm that an old Session from Implicit Grant is stale."""
-    implicit_grant_session.oauth2credential.expires_in_seconds = 1
-    assert implicit_grant_session.oauth2credential.is_stale()
-
-
-def test_old_client_credential_session_is_stale(
-    client_credential_grant_session,
-):
-    """Confirm that an old Session from Client Credential Grant is stale."""
-    client_credential_grant_session.oauth2credential.expires_in_seconds = 1
-    assert client_credential_grant_session.oauth2credential.is_stale()
+def test_old_grant_session_is_stale(grant_session):
+    """Confirm that an old Session from an OAuth 2.0 grant is stale."""
+    # copy so the shared fixture stays fresh for other tests
+    oauth2credential = copy(grant_session.oauth2credential)
+    oauth2credential.expires_in_seconds = 1
+    assert oauth2credential.is_stale()
 
 
 def test_make_session_from_authorization_code_response(
@@ -0,0 +1,88 @@
+# Copyright (c) 2017 Uber Technologies, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from time import time
+
+from pytest import fixture
+
+from example import token_cache
+from example.utils import create_uber_client
+from uber_rides.utils import auth
+
+
+CLIENT_ID = 'xxx'
+CLIENT_SECRET = 'xxx'
+REDIRECT_URL = 'https://uberapitester.com/api/v1/uber/oauth'
+SCOPES = frozenset(['profile', 'history'])
+
+TOKEN_A = 'token-a'
+TOKEN_B = 'token-b'
+REFRESH_TOKEN = 'xxx'
+
+EXPIRES_IN_SECONDS = 3000
+
+
+@fixture(autouse=True)
+def empty_cache():
+    """Start and end every test with an empty client cache."""
+    token_cache._clients.clear()
+    yield
+    token_cache._clients.clear()
+
+
+def make_credentials(access_token, grant_type=auth.AUTHORIZATION_CODE_GRANT):
+    """Build credentials as import_oauth2_credentials returns them."""
+    return {
+        'access_token': access_token,
+        'client_id': CLIENT_ID,
+        'client_secret': CLIENT_SECRET,
+        'expires_in_seconds': EXPIRES_IN_SECONDS,
+        'grant_type': grant_type,
+        'issued_at': int(time()),
+        'redirect_url': REDIRECT_URL,
+        'refresh_token': REFRESH_TOKEN,
+        'scopes': SCOPES,
+    }
+
+
+def test_same_credentials_reuse_client():
+    """Reuse the client built from identical credentials."""
+    api_client = create_uber_client(make_credentials(TOKEN_A))
+    assert create_uber_client(make_credentials(TOKEN_A)) is api_client
+
+
+def test_new_access_token_builds_new_client():
+    """Build a new client when the access token changes."""
+    client_a = create_uber_client(make_credentials(TOKEN_A))
+    client_b = create_uber_client(make_credentials(TOKEN_B))
+
+    assert client_b is not client_a
+    assert client_a.session.oauth2credential.access_token == TOKEN_A
+    assert client_b.session.oauth2credential.access_token == TOKEN_B
+
+
+def test_expired_implicit_grant_client_dropped():
+    """Drop a cached client whose token it cannot refresh has expired."""
+    credentials = make_credentials(TOKEN_A, auth.IMPLICIT_GRANT)
+    api_client = create_uber_client(credentials)
+    api_client.session.oauth2credential.expires_in_seconds = time()
+
+    assert token_cache.get_client(credentials) is None
+    assert create_uber_client(credentials) is not api_client
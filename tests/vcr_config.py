@@ -26,15 +26,10 @@ overrides will take precedent over the global
 configuration below.
 """
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
 import vcr
 
 uber_vcr = vcr.VCR(
-    serializer='yaml',
+    serializer='json',
     cassette_library_dir='tests/fixtures',
 
     # disable gzip
@@ -44,8 +39,8 @@ uber_vcr = vcr.VCR(
     record_mode='once',
 
     # configure matching features that vcr uses to identify identical requests
-    match_on=['uri', 'method'],
+    match_on=('uri', 'method'),
 
     # scrub sensitive information from cassette files
-    filter_headers=['Authorization'],
+    filter_headers=('Authorization',),
 )
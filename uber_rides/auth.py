@@ -37,17 +37,16 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 from collections import OrderedDict
-from random import SystemRandom
+from hmac import compare_digest
 from requests import codes
 from requests import post
-from string import ascii_letters
-from string import digits
+from secrets import token_urlsafe
 
 try:
-    from urllib.parse import parse_qs
+    from urllib.parse import parse_qsl
     from urllib.parse import urlparse
 except ImportError:
-    from urlparse import parse_qs
+    from urlparse import parse_qsl
     from urlparse import urlparse
 
 from uber_rides.errors import ClientError
@@ -61,6 +60,9 @@ from uber_rides.utils.request import build_url
 class OAuth2(object):
     """The parent class for all OAuth 2.0 grant types."""
 
+    # redirect_urls return data after query identifier (?) by default
+    _REDIRECT_URL_COMPONENT = 'query'
+
     def __init__(self, client_id, scopes):
         """Initialize OAuth 2.0 Class.
 
@@ -75,6 +77,31 @@ class OAuth2(object):
         self.client_id = client_id
         self.scopes = scopes
 
+        # space delimited scopes and the scopes they were joined from
+        self._scopes_string = None
+        self._joined_scopes = None
+
+        # last authorization URL built and the arguments it was built from
+        self._authorization_url = None
+        self._authorization_url_args = None
+
+    def _get_scopes_string(self):
+        """Join scopes into the space delimited form sent to the server.
+
+        The joined string is reused until the scopes change.
+
+        Returns
+            (str)
+                The sorted scopes separated by spaces.
+        """
+        scopes = self.scopes
+
+        if self._joined_scopes is None or scopes != self._joined_scopes:
+            self._scopes_string = ' '.join(sorted(scopes))
+            self._joined_scopes = frozenset(scopes)
+
+        return self._scopes_string
+
     def _build_authorization_request_url(
         self,
         response_type,
@@ -108,7 +135,7 @@ class OAuth2(object):
             raise UberIllegalState(message.format(response_type))
 
         args = OrderedDict([
-            ('scope', ' '.join(self.scopes)),
+            ('scope', self._get_scopes_string()),
             ('state', state),
             ('redirect_uri', redirect_url),
             ('response_type', response_type),
@@ -117,6 +144,45 @@ class OAuth2(object):
 
         return build_url(auth.AUTH_HOST, auth.AUTHORIZE_PATH, args)
 
+    def _get_authorization_url(self, response_type, redirect_url, state=None):
+        """Return the authorization URL, building it only when inputs change.
+
+        The URL is rebuilt whenever any argument, client_id or scopes
+        differ from the ones the last URL was built from.
+
+        Parameters
+            response_type (str)
+                Either 'code' (Authorization Code Grant) or
+                'token' (Implicit Grant)
+            redirect_url (str)
+                The URL that the Uber server will redirect the user to after
+                finishing authorization.
+            state (str)
+                Optional CSRF State token to send to server.
+
+        Returns
+            (str)
+                The fully constructed authorization request URL.
+        """
+        # client_id and scopes are public too, so they are part of the key
+        args = (
+            response_type,
+            redirect_url,
+            state,
+            self.client_id,
+            self._get_scopes_string(),
+        )
+
+        if args != self._authorization_url_args:
+            self._authorization_url = self._build_authorization_request_url(
+                response_type,
+                redirect_url,
+                state,
+            )
+            self._authorization_url_args = args
+
+        return self._authorization_url
+
     def _extract_query(self, redirect_url):
         """Extract query parameters from a url.
 
@@ -129,14 +195,12 @@ class OAuth2(object):
             (dict)
                 A dictionary of query parameters.
         """
-        qs = urlparse(redirect_url)
-
-        # Implicit Grant redirect_urls have data after fragment identifier (#)
-        # All other redirect_urls return data after query identifier (?)
-        qs = qs.fragment if isinstance(self, ImplicitGrant) else qs.query
+        qs = getattr(urlparse(redirect_url), self._REDIRECT_URL_COMPONENT)
 
-        query_params = parse_qs(qs)
-        query_params = {qp: query_params[qp][0] for qp in query_params}
+        # keep the first value of repeated parameters, as parse_qs would
+        query_params = {}
+        for key, value in parse_qsl(qs):
+            query_params.setdefault(key, value)
 
         return query_params
 
@@ -198,8 +262,8 @@ class AuthorizationCodeGrant(OAuth2):
         URL and are checked when receiving responses from the Uber Auth
         server to prevent request forgery.
         """
-        choices = ascii_letters + digits
-        return ''.join(SystemRandom().choice(choices) for _ in range(length))
+        # each random byte encodes to 4/3 url-safe characters
+        return token_urlsafe((length * 3 + 3) // 4)[:length]
 
     def get_authorization_url(self):
         """Start the Authorization Code Grant process.
@@ -213,7 +277,7 @@ class AuthorizationCodeGrant(OAuth2):
                 The fully constructed authorization request URL.
                 Tell the user to visit this URL and approve your app.
         """
-        return self._build_authorization_request_url(
+        return self._get_authorization_url(
             response_type=auth.CODE_RESPONSE_TYPE,
             redirect_url=self.redirect_url,
             state=self.state_token,
@@ -246,7 +310,11 @@ class AuthorizationCodeGrant(OAuth2):
                 error_message = 'Bad Request. Missing state parameter.'
                 raise UberIllegalState(error_message)
 
-            if self.state_token != received_state_token:
+            # compare in constant time so the token cannot be probed
+            if not compare_digest(
+                str(self.state_token).encode('utf-8'),
+                received_state_token.encode('utf-8'),
+            ):
                 error_message = 'CSRF Error. Expected {}, got {}'
                 error_message = error_message.format(
                     self.state_token,
@@ -324,6 +392,9 @@ class ImplicitGrant(OAuth2):
     receives the access token as the result of the authorization request.
     """
 
+    # Implicit Grant redirect_urls have data after fragment identifier (#)
+    _REDIRECT_URL_COMPONENT = 'fragment'
+
     def __init__(self, client_id, scopes, redirect_url):
         """Initialize ImplicitGrant Class.
 
@@ -350,7 +421,7 @@ class ImplicitGrant(OAuth2):
             (str)
                 The fully constructed authorization request URL.
         """
-        return self._build_authorization_request_url(
+        return self._get_authorization_url(
             response_type=auth.TOKEN_RESPONSE_TYPE,
             redirect_url=self.redirect_url,
         )
@@ -427,11 +498,15 @@ class ClientCredentialGrant(OAuth2):
             (Session)
                 A Session object with OAuth 2.0 credentials.
         """
+        scopes = self.scopes
+        if scopes is not None:
+            scopes = self._get_scopes_string()
+
         response = _request_access_token(
             grant_type=auth.CLIENT_CREDENTIALS_GRANT,
             client_id=self.client_id,
             client_secret=self.client_secret,
-            scopes=self.scopes,
+            scopes=scopes,
         )
 
         oauth2credential = OAuth2Credential.make_from_response(
@@ -463,9 +538,10 @@ def _request_access_token(
             Your app's Client ID.
         client_secret (str)
             Your app's Client Secret.
-        scopes (set)
-            Set of permission scopes to request.
-            (e.g. {'profile', 'history'})
+        scopes (set or str)
+            Set of permission scopes to request, or the same scopes
+            already joined into a space delimited string.
+            (e.g. {'profile', 'history'} or 'history profile')
         code (str)
             The authorization code to switch for an access token.
             Only used in Authorization Code Grant.
@@ -486,7 +562,7 @@ def _request_access_token(
     """
     url = build_url(auth.AUTH_HOST, auth.ACCESS_TOKEN_PATH)
 
-    if isinstance(scopes, set):
+    if isinstance(scopes, (set, frozenset)):
         scopes = ' '.join(scopes)
 
     args = {
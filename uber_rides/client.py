@@ -717,6 +717,10 @@ class UberRidesClient(object):
         credential = self.session.oauth2credential
         if credential.is_stale():
             refresh_session = refresh_access_token(credential)
+
+            # keep the existing connection pool instead of the new one
+            refresh_session.requests_session.close()
+            refresh_session.requests_session = self.session.requests_session
             self.session = refresh_session
 
     def revoke_oauth_credential(self):
@@ -25,10 +25,14 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from requests import Session
 from string import ascii_letters
 from string import digits
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 from uber_rides.errors import UberIllegalState
 from uber_rides.utils import http
 from uber_rides.utils.request import build_url
@@ -54,7 +58,7 @@ class Response(object):
         self.headers = response.headers
 
         try:
-            self.json = response.json()
+            self.json = loads(response.content)
         except:
             self.json = None
 
@@ -132,7 +136,7 @@ class Request(object):
                 A Response object, whichcontains a server's
                 response to an HTTP request.
         """
-        session = Session()
+        session = self.auth_session.requests_session
         response = session.send(prepared_request)
         return Response(response)
 
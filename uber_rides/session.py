@@ -29,6 +29,7 @@ from time import time
 from uber_rides.errors import ClientError
 from uber_rides.errors import UberIllegalState
 from uber_rides.utils import auth
+from uber_rides.utils.request import create_requests_session
 
 
 EXPIRES_THRESHOLD_SECONDS = 500
@@ -46,6 +47,7 @@ class Session(object):
         self,
         server_token=None,
         oauth2credential=None,
+        requests_session=None,
     ):
         """Initialize a Session.
 
@@ -56,6 +58,10 @@ class Session(object):
             oauth2credential (OAuth2Credential)
                 Access token and additional OAuth 2.0 credentials used
                 to access protected resources.
+            requests_session (requests.Session)
+                Optional HTTP session to send requests with, so that
+                connections are pooled and reused across API calls.
+                If omitted, a pooled one is created.
 
         Raises
             UberIllegalState (APIError)
@@ -86,6 +92,12 @@ class Session(object):
             self.token_type = auth.OAUTH_TOKEN_TYPE
             self.server_token = None
 
+        # created up front so threads sharing a Session share one pool
+        if requests_session is None:
+            requests_session = create_requests_session()
+
+        self.requests_session = requests_session
+
 
 class OAuth2Credential(object):
     """A class to store OAuth 2.0 credentials.
@@ -26,6 +26,10 @@ QUERY_METHODS = frozenset(['GET', 'DELETE'])
 
 DEFAULT_CONTENT_HEADERS = {'content-type': 'application/json'}
 
+# connection pool sizes for the requests.Session kept by each Session
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 50
+
 STATUS_OK = 200
 STATUS_UNAUTHORIZED = 401
 STATUS_CONFLICT = 409
@@ -25,6 +25,8 @@ from __future__ import unicode_literals
 
 from json import dumps
 from requests import Request
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 try:
     from urllib.parse import quote
@@ -39,6 +41,30 @@ from uber_rides.utils.handlers import error_handler
 from uber_rides.utils import http
 
 
+def create_requests_session(max_retries=0):
+    """Create an HTTP session that keeps connections to Uber alive.
+
+    Parameters
+        max_retries (int or urllib3.util.retry.Retry)
+            Optional retry policy for failed connections, passed to
+            each mounted adapter. Requests are not retried by default.
+
+    Returns
+        (requests.Session)
+            A session with pooled adapters mounted for http and https.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=http.DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=http.DEFAULT_POOL_MAXSIZE,
+        max_retries=max_retries,
+    )
+
+    session = Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 def generate_data(method, args):
     """Assign arguments to body or URL of an HTTP request.
 